@@ -0,0 +1,66 @@
+"""HTTP middleware."""
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+# Header added to every HTTP response
+_ALLOW_ORIGIN = (b"access-control-allow-origin", b"*")
+
+# Headers answering a CORS preflight request, built once at import
+_PREFLIGHT_HEADERS = [
+    _ALLOW_ORIGIN,
+    (b"access-control-allow-methods", b"GET, POST, OPTIONS"),
+    (b"access-control-max-age", b"600"),
+    (b"content-length", b"0"),
+]
+
+
+class CORSMiddleware:
+    """Allow cross-origin requests from any origin.
+
+    A pure ASGI middleware with precomputed headers: preflight requests are
+    answered directly, and other responses get a single extra header on
+    their start message, so streamed body chunks pass through untouched.
+    """
+
+    def __init__(self, app: ASGIApp):
+        """Initialize CORS middleware.
+
+        Args:
+            app: Wrapped ASGI application
+        """
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Handle an ASGI connection."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        if scope["method"] == "OPTIONS":
+            request_headers = dict(scope["headers"])
+            if b"access-control-request-method" in request_headers:
+                await self._preflight(request_headers, send)
+                return
+
+        async def send_with_cors(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                message["headers"] = [*message.get("headers", ()), _ALLOW_ORIGIN]
+            await send(message)
+
+        await self.app(scope, receive, send_with_cors)
+
+    @staticmethod
+    async def _preflight(request_headers: dict[bytes, bytes], send: Send) -> None:
+        """Answer a CORS preflight request, allowing the requested headers.
+
+        Args:
+            request_headers: Raw request headers
+            send: ASGI send callable
+        """
+        headers = _PREFLIGHT_HEADERS
+        requested = request_headers.get(b"access-control-request-headers")
+        if requested:
+            headers = [*headers, (b"access-control-allow-headers", requested)]
+
+        await send({"type": "http.response.start", "status": 204, "headers": headers})
+        await send({"type": "http.response.body", "body": b""})
@@ -1,9 +1,12 @@
 """API routes for GitHub repository analysis."""
 
+import asyncio
 import uuid
+from contextlib import aclosing
 from typing import AsyncGenerator
 
-from fastapi import APIRouter, HTTPException, status
+import orjson
+from fastapi import APIRouter, HTTPException, Request, status
 from fastapi.responses import StreamingResponse
 from loguru import logger
 
@@ -17,11 +20,16 @@ from app.api.schemas import (
     PDFReportStatus,
 )
 from app.config import get_settings
-from app.services.analyzer import create_analyzer
+from app.core.streaming import with_heartbeat
+from app.services.analyzer import RepositoryAnalyzer
+from app.tasks.celery_app import celery_app
 from app.tasks.celery_tasks import generate_pdf_report_task
 
 router = APIRouter(prefix="/api", tags=["analysis"])
 
+# SSE comment line sent while the analysis stream is idle
+SSE_KEEPALIVE = b": keepalive\n\n"
+
 
 @router.get("/health", response_model=HealthResponse)
 async def health_check() -> HealthResponse:
@@ -36,32 +44,46 @@ async def health_check() -> HealthResponse:
 
 
 @router.post("/analyze")
-async def analyze_repository(request: AnalyzeRequest) -> StreamingResponse:
+async def analyze_repository(request: AnalyzeRequest, http_request: Request) -> StreamingResponse:
     """Analyze repository and stream progress via SSE.
 
     Args:
         request: Analysis request with repository URL and language
+        http_request: Incoming HTTP request, used to reach the shared analyzer
 
     Returns:
         SSE streaming response with real-time analysis progress
     """
+    settings = get_settings()
+    # Analyzer initialized once by the application lifespan
+    analyzer: RepositoryAnalyzer = http_request.app.state.analyzer
     repo_url = str(request.repo_url)
     language = request.language
     logger.info(f"Starting analysis for {repo_url} (language: {language})")
 
-    async def event_generator() -> AsyncGenerator[str, None]:
-        """Generate SSE events from analysis stream."""
+    async def analysis_stream() -> AsyncGenerator[bytes, None]:
+        """Format analysis events as SSE messages."""
+        async for event in analyzer.stream_analysis(repo_url, language=language):
+            yield event.to_sse_format()
+
+    async def event_generator() -> AsyncGenerator[bytes, None]:
+        """Generate SSE events from analysis stream with keepalive comments."""
+        stream = with_heartbeat(
+            analysis_stream(), settings.sse_heartbeat_interval, SSE_KEEPALIVE
+        )
         try:
-            async with create_analyzer() as analyzer:
-                async for event in analyzer.stream_analysis(repo_url, language=language):
-                    yield event.to_sse_format()
+            # Close the stream as soon as the client goes away so the
+            # analysis running behind it is stopped too
+            async with aclosing(stream):
+                async for message in stream:
+                    yield message
         except Exception as e:
             logger.error(f"Error in SSE stream: {e}")
             error_event = {
                 "type": "error",
                 "data": {"error": str(e)},
             }
-            yield f"data: {error_event}\n\n"
+            yield b"data: " + orjson.dumps(error_event) + b"\n\n"
 
     return StreamingResponse(
         event_generator(),
@@ -86,23 +108,29 @@ async def generate_pdf_report(request: PDFReportRequest) -> PDFReportResponse:
         PDF report response with task ID
     """
     repo_url = str(request.repo_url)
-    project_name = request.project_name or repo_url.split("/")[-1]
+    project_name = request.project_name or repo_url.rpartition("/")[2]
 
     logger.info(f"Submitting PDF generation task for {repo_url}")
 
-    # Submit Celery task
-    task = generate_pdf_report_task.delay(
-        analysis_result=request.analysis_result,
-        repo_url=repo_url,
-        project_name=project_name,
+    # Submit Celery task from a worker thread: payload serialization and the
+    # broker round trip are blocking
+    task_id = str(uuid.uuid4())
+    await asyncio.to_thread(
+        generate_pdf_report_task.apply_async,
+        kwargs={
+            "analysis_result": request.analysis_result,
+            "repo_url": repo_url,
+            "project_name": project_name,
+        },
+        task_id=task_id,
     )
 
-    logger.info(f"PDF generation task submitted: {task.id}")
+    logger.info(f"PDF generation task submitted: {task_id}")
 
     return PDFReportResponse(
-        task_id=task.id,
+        task_id=task_id,
         status="pending",
-        status_url=f"/api/report/pdf/{task.id}",
+        status_url=f"/api/report/pdf/{task_id}",
     )
 
 
@@ -119,24 +147,24 @@ async def get_pdf_report_status(task_id: str) -> PDFReportStatus:
     Raises:
         HTTPException: If task not found
     """
-    from celery.result import AsyncResult
-
-    task = AsyncResult(task_id)
+    # Result backend lookups are blocking I/O; keep them off the event loop
+    meta = await asyncio.to_thread(celery_app.backend.get_task_meta, task_id)
+    state = meta["status"]
+    result = meta.get("result")
 
-    if task.state == "PENDING":
+    if state == "PENDING":
         return PDFReportStatus(
             task_id=task_id,
             status="pending",
             progress=0,
         )
-    elif task.state == "PROGRESS":
+    elif state == "PROGRESS":
         return PDFReportStatus(
             task_id=task_id,
             status="processing",
-            progress=task.info.get("progress", 0) if task.info else 0,
+            progress=result.get("progress", 0) if result else 0,
         )
-    elif task.state == "SUCCESS":
-        result = task.result
+    elif state == "SUCCESS":
         return PDFReportStatus(
             task_id=task_id,
             status="completed",
@@ -144,11 +172,11 @@ async def get_pdf_report_status(task_id: str) -> PDFReportStatus:
             download_url=result.get("download_url"),
             completed_at=result.get("completed_at"),
         )
-    elif task.state == "FAILURE":
+    elif state == "FAILURE":
         return PDFReportStatus(
             task_id=task_id,
             status="failed",
-            error=str(task.info),
+            error=str(celery_app.backend.exception_to_python(result)),
         )
     else:
         raise HTTPException(
@@ -23,6 +23,12 @@ class Settings(BaseSettings):
     host: str = Field(default="0.0.0.0", description="Host to bind")
     port: int = Field(default=8000, description="Port to bind")
     log_level: str = Field(default="INFO", description="Logging level")
+    reload: bool = Field(default=False, description="Reload the server on code changes")
+    workers: int = Field(default=1, description="Number of server worker processes")
+    access_log: bool = Field(default=False, description="Log every HTTP request")
+    sse_heartbeat_interval: float = Field(
+        default=15.0, description="Seconds of SSE inactivity before a keepalive comment"
+    )
 
     # LLM Provider
     llm_provider: Literal["openai", "gemini", "openrouter"] = Field(
@@ -57,6 +63,14 @@ class Settings(BaseSettings):
 
     # MCP Server
     mcp_server: str = Field(default="github-repo-mcp", description="MCP server name")
+    mcp_tool_cache_dir: Path = Field(
+        default=Path.home() / ".cache" / "github-repo-lens",
+        description="Directory for cached MCP tool descriptors",
+    )
+    mcp_tool_cache_ttl: float = Field(
+        default=86400.0,
+        description="Seconds cached MCP tool descriptors stay valid (0 disables the cache)",
+    )
 
     # Celery
     celery_broker_url: str = Field(
@@ -70,14 +84,15 @@ class Settings(BaseSettings):
     report_output_dir: Path = Field(
         default=Path("/tmp/reports"), description="Report output directory"
     )
+    pdf_backend: Literal["reportlab", "weasyprint"] = Field(
+        default="reportlab", description="PDF rendering backend"
+    )
 
-    @field_validator("report_output_dir", mode="before")
+    @field_validator("mcp_tool_cache_dir")
     @classmethod
-    def ensure_path(cls, v: str | Path) -> Path:
-        """Ensure report output directory is a Path."""
-        path = Path(v) if isinstance(v, str) else v
-        path.mkdir(parents=True, exist_ok=True)
-        return path
+    def expand_user(cls, v: Path) -> Path:
+        """Expand a leading ~ in the tool cache directory."""
+        return v.expanduser()
 
     def validate_provider_config(self) -> None:
         """Validate that required API keys are set for the selected provider."""
@@ -97,3 +112,13 @@ def get_settings() -> Settings:
     settings = Settings()
     settings.validate_provider_config()
     return settings
+
+
+@lru_cache
+def get_worker_settings() -> Settings:
+    """Get cached settings for Celery workers.
+
+    Workers only render and clean up reports, so LLM provider keys are not
+    required and not validated.
+    """
+    return Settings()
@@ -1,18 +1,120 @@
 """LangGraph agent for repository analysis."""
 
-import json
-from typing import Annotated, Literal, TypedDict
+import asyncio
+from functools import lru_cache
+from typing import Annotated, Any, Literal, TypedDict
 
+import orjson
 from langchain_core.language_models.chat_models import BaseChatModel
-from langchain_core.messages import AIMessage, BaseMessage, HumanMessage, ToolMessage
+from langchain_core.messages import (
+    AIMessage,
+    AIMessageChunk,
+    BaseMessage,
+    HumanMessage,
+    ToolMessage,
+)
 from langchain_core.tools import BaseTool
 from langgraph.graph import END, START, StateGraph
 from langgraph.graph.message import add_messages
 from langgraph.prebuilt import tools_condition
 from loguru import logger
 
+from app.core.streaming import buffered
 from app.prompts.base import get_prompt_loader
 
+# Number of graph events read ahead while the consumer handles the current one
+_EVENT_BUFFER_SIZE = 4
+
+# Run types whose events stream_analysis consumes; other graph events are
+# dropped by LangChain before they reach the stream
+_STREAM_EVENT_TYPES = ["chat_model", "tool"]
+
+# Maximum tool result length sent back to the LLM
+_MAX_TOOL_RESULT_CHARS = 100_000
+_TRUNCATION_MARKER = "\n...[truncated]"
+
+# Placeholder substituted into cached prompts in place of the repository URL
+_REPO_URL_PLACEHOLDER = "{repo_url}"
+
+
+@lru_cache(maxsize=32)
+def _render_prompts(language: str) -> tuple[str, str]:
+    """Render system and analysis prompts once per language.
+
+    The repository URL is left as a placeholder so the rendered prompts can
+    be reused across requests with a plain string substitution.
+
+    Args:
+        language: Analysis report language
+
+    Returns:
+        Tuple of (system prompt, analysis prompt) templates
+    """
+    prompt_loader = get_prompt_loader()
+    system_prompt = prompt_loader.render(
+        "system", repo_url=_REPO_URL_PLACEHOLDER, language=language
+    )
+    analysis_prompt = prompt_loader.render(
+        "analysis", repo_url=_REPO_URL_PLACEHOLDER, language=language
+    )
+    return system_prompt, analysis_prompt
+
+
+def _build_prompt(repo_url: str, language: str) -> str:
+    """Build the full analysis prompt for a repository.
+
+    Args:
+        repo_url: GitHub repository URL
+        language: Analysis report language
+
+    Returns:
+        Combined system and analysis prompt
+    """
+    system_prompt, analysis_prompt = _render_prompts(language)
+    full_prompt = f"{system_prompt}\n\n{analysis_prompt}"
+    return full_prompt.replace(_REPO_URL_PLACEHOLDER, repo_url)
+
+
+def _is_content_blocks(result: Any) -> bool:
+    """Check whether a tool result is a list of MCP text content blocks."""
+    return (
+        isinstance(result, list)
+        and bool(result)
+        and isinstance(result[0], dict)
+        and "text" in result[0]
+    )
+
+
+def _format_tool_result(result: Any) -> str:
+    """Format a tool result as a string to ensure compatibility.
+
+    Structured results are serialized as compact JSON, and content longer
+    than ``_MAX_TOOL_RESULT_CHARS`` is truncated to bound the prompt size.
+
+    Args:
+        result: Raw tool result
+
+    Returns:
+        String content for the tool message
+    """
+    if isinstance(result, str):
+        content = result
+    elif _is_content_blocks(result):
+        # Handle list of content blocks from MCP
+        content = "\n".join(
+            text
+            for item in result
+            if isinstance(item, dict) and (text := item.get("text")) is not None
+        )
+    elif isinstance(result, (dict, list)):
+        content = orjson.dumps(result, option=orjson.OPT_NON_STR_KEYS).decode()
+    else:
+        content = str(result)
+
+    if len(content) > _MAX_TOOL_RESULT_CHARS:
+        content = content[:_MAX_TOOL_RESULT_CHARS] + _TRUNCATION_MARKER
+    return content
+
 
 class AgentState(TypedDict):
     """State for the analysis agent."""
@@ -36,6 +138,8 @@ class RepositoryAnalysisAgent:
         """
         self.llm = llm
         self.tools = tools
+        self._tools_by_name = {tool.name: tool for tool in tools}
+        self._llm_with_tools = llm.bind_tools(tools)
         self.prompt_loader = get_prompt_loader()
         self.graph = self._build_graph()
 
@@ -77,14 +181,10 @@ class RepositoryAnalysisAgent:
             Updated state with tool results
         """
         messages = state["messages"]
-        if not messages:
-            return {"messages": []}
-
-        last_message = messages[-1]
+        last_message = messages[-1] if messages else None
         if not isinstance(last_message, AIMessage) or not last_message.tool_calls:
             return {"messages": []}
 
-        tools_by_name = {tool.name: tool for tool in self.tools}
         tool_messages = []
 
         for tool_call in last_message.tool_calls:
@@ -92,10 +192,10 @@ class RepositoryAnalysisAgent:
             tool_args = tool_call["args"]
             tool_call_id = tool_call["id"]
 
-            logger.debug(f"Executing tool: {tool_name} with args: {tool_args}")
+            logger.debug("Executing tool: {} with args: {}", tool_name, tool_args)
 
             try:
-                tool = tools_by_name.get(tool_name)
+                tool = self._tools_by_name.get(tool_name)
                 if not tool:
                     error_msg = f"Tool {tool_name} not found"
                     logger.error(error_msg)
@@ -110,20 +210,7 @@ class RepositoryAnalysisAgent:
                     continue
 
                 result = tool.invoke(tool_args)
-
-                # Format result as string to ensure compatibility
-                if isinstance(result, str):
-                    content = result
-                elif isinstance(result, dict):
-                    content = json.dumps(result, indent=2)
-                elif isinstance(result, list):
-                    # Handle list of content blocks from MCP
-                    if result and isinstance(result[0], dict) and "text" in result[0]:
-                        content = "\n".join(item["text"] for item in result if "text" in item)
-                    else:
-                        content = json.dumps(result, indent=2)
-                else:
-                    content = str(result)
+                content = _format_tool_result(result)
 
                 tool_messages.append(
                     ToolMessage(
@@ -132,7 +219,7 @@ class RepositoryAnalysisAgent:
                         tool_call_id=tool_call_id,
                     )
                 )
-                logger.debug(f"Tool {tool_name} executed successfully")
+                logger.debug("Tool {} executed successfully", tool_name)
 
             except Exception as e:
                 error_msg = f"Error executing tool {tool_name}: {str(e)}"
@@ -151,6 +238,8 @@ class RepositoryAnalysisAgent:
     async def _custom_tool_node_async(self, state: AgentState) -> dict:
         """Async custom tool node that properly formats tool results.
 
+        Tool calls from a single AI message are executed concurrently.
+
         Args:
             state: Current agent state
 
@@ -158,76 +247,62 @@ class RepositoryAnalysisAgent:
             Updated state with tool results
         """
         messages = state["messages"]
-        if not messages:
-            return {"messages": []}
-
-        last_message = messages[-1]
+        last_message = messages[-1] if messages else None
         if not isinstance(last_message, AIMessage) or not last_message.tool_calls:
             return {"messages": []}
 
-        tools_by_name = {tool.name: tool for tool in self.tools}
-        tool_messages = []
+        tool_messages = await asyncio.gather(
+            *(self._execute_tool_call_async(tool_call) for tool_call in last_message.tool_calls)
+        )
 
-        for tool_call in last_message.tool_calls:
-            tool_name = tool_call["name"]
-            tool_args = tool_call["args"]
-            tool_call_id = tool_call["id"]
+        return {"messages": list(tool_messages)}
 
-            logger.debug(f"Executing tool: {tool_name} with args: {tool_args}")
+    async def _execute_tool_call_async(self, tool_call: dict) -> ToolMessage:
+        """Execute a single tool call asynchronously.
 
-            try:
-                tool = tools_by_name.get(tool_name)
-                if not tool:
-                    error_msg = f"Tool {tool_name} not found"
-                    logger.error(error_msg)
-                    tool_messages.append(
-                        ToolMessage(
-                            content=error_msg,
-                            name=tool_name,
-                            tool_call_id=tool_call_id,
-                            status="error",
-                        )
-                    )
-                    continue
+        Args:
+            tool_call: Tool call emitted by the LLM
 
-                result = await tool.ainvoke(tool_args)
-
-                # Format result as string to ensure compatibility
-                if isinstance(result, str):
-                    content = result
-                elif isinstance(result, dict):
-                    content = json.dumps(result, indent=2)
-                elif isinstance(result, list):
-                    # Handle list of content blocks from MCP
-                    if result and isinstance(result[0], dict) and "text" in result[0]:
-                        content = "\n".join(item["text"] for item in result if "text" in item)
-                    else:
-                        content = json.dumps(result, indent=2)
-                else:
-                    content = str(result)
+        Returns:
+            Tool message with the formatted result or error
+        """
+        tool_name = tool_call["name"]
+        tool_args = tool_call["args"]
+        tool_call_id = tool_call["id"]
 
-                tool_messages.append(
-                    ToolMessage(
-                        content=content,
-                        name=tool_name,
-                        tool_call_id=tool_call_id,
-                    )
-                )
-                logger.debug(f"Tool {tool_name} executed successfully")
+        logger.debug("Executing tool: {} with args: {}", tool_name, tool_args)
 
-            except Exception as e:
-                error_msg = f"Error executing tool {tool_name}: {str(e)}"
+        try:
+            tool = self._tools_by_name.get(tool_name)
+            if not tool:
+                error_msg = f"Tool {tool_name} not found"
                 logger.error(error_msg)
-                tool_messages.append(
-                    ToolMessage(
-                        content=error_msg,
-                        name=tool_name,
-                        tool_call_id=tool_call_id,
-                        status="error",
-                    )
+                return ToolMessage(
+                    content=error_msg,
+                    name=tool_name,
+                    tool_call_id=tool_call_id,
+                    status="error",
                 )
 
-        return {"messages": tool_messages}
+            result = await tool.ainvoke(tool_args)
+            content = _format_tool_result(result)
+
+            logger.debug("Tool {} executed successfully", tool_name)
+            return ToolMessage(
+                content=content,
+                name=tool_name,
+                tool_call_id=tool_call_id,
+            )
+
+        except Exception as e:
+            error_msg = f"Error executing tool {tool_name}: {str(e)}"
+            logger.error(error_msg)
+            return ToolMessage(
+                content=error_msg,
+                name=tool_name,
+                tool_call_id=tool_call_id,
+                status="error",
+            )
 
     def _agent_node(self, state: AgentState) -> dict:
         """Agent node that processes messages and decides next action.
@@ -240,13 +315,10 @@ class RepositoryAnalysisAgent:
         """
         messages = state["messages"]
 
-        logger.debug(f"Agent node processing {len(messages)} messages")
-
-        # Bind tools to LLM
-        llm_with_tools = self.llm.bind_tools(self.tools)
+        logger.debug("Agent node processing {} messages", len(messages))
 
         # Invoke LLM
-        response = llm_with_tools.invoke(messages)
+        response = self._llm_with_tools.invoke(messages)
 
         return {"messages": [response]}
 
@@ -261,33 +333,26 @@ class RepositoryAnalysisAgent:
         """
         messages = state["messages"]
 
-        logger.debug(f"Agent node processing {len(messages)} messages")
-
-        # Bind tools to LLM
-        llm_with_tools = self.llm.bind_tools(self.tools)
+        logger.debug("Agent node processing {} messages", len(messages))
 
         # Invoke LLM asynchronously
-        response = await llm_with_tools.ainvoke(messages)
+        response = await self._llm_with_tools.ainvoke(messages)
 
         return {"messages": [response]}
 
-    def analyze(self, repo_url: str) -> dict:
+    def analyze(self, repo_url: str, language: str = "en") -> dict:
         """Perform synchronous repository analysis.
 
         Args:
             repo_url: GitHub repository URL
+            language: Analysis report language (en, zh, ja, etc.)
 
         Returns:
             Final state with analysis results
         """
         logger.info(f"Starting synchronous analysis for {repo_url}")
 
-        # Load system and analysis prompts
-        system_prompt = self.prompt_loader.render("system", repo_url=repo_url)
-        analysis_prompt = self.prompt_loader.render("analysis", repo_url=repo_url)
-
-        # Combine prompts
-        full_prompt = f"{system_prompt}\n\n{analysis_prompt}"
+        full_prompt = _build_prompt(repo_url, language)
 
         # Create initial state
         initial_state = {
@@ -302,23 +367,19 @@ class RepositoryAnalysisAgent:
         logger.info("Synchronous analysis completed")
         return final_state
 
-    async def analyze_async(self, repo_url: str) -> dict:
+    async def analyze_async(self, repo_url: str, language: str = "en") -> dict:
         """Perform asynchronous repository analysis.
 
         Args:
             repo_url: GitHub repository URL
+            language: Analysis report language (en, zh, ja, etc.)
 
         Returns:
             Final state with analysis results
         """
         logger.info(f"Starting asynchronous analysis for {repo_url}")
 
-        # Load system and analysis prompts
-        system_prompt = self.prompt_loader.render("system", repo_url=repo_url)
-        analysis_prompt = self.prompt_loader.render("analysis", repo_url=repo_url)
-
-        # Combine prompts
-        full_prompt = f"{system_prompt}\n\n{analysis_prompt}"
+        full_prompt = _build_prompt(repo_url, language)
 
         # Create initial state
         initial_state = {
@@ -345,12 +406,7 @@ class RepositoryAnalysisAgent:
         """
         logger.info(f"Starting streaming analysis for {repo_url} (language: {language})")
 
-        # Load system and analysis prompts
-        system_prompt = self.prompt_loader.render("system", repo_url=repo_url, language=language)
-        analysis_prompt = self.prompt_loader.render("analysis", repo_url=repo_url, language=language)
-
-        # Combine prompts
-        full_prompt = f"{system_prompt}\n\n{analysis_prompt}"
+        full_prompt = _build_prompt(repo_url, language)
 
         # Create initial state
         initial_state = {
@@ -359,27 +415,31 @@ class RepositoryAnalysisAgent:
             "analysis_stage": "init",
         }
 
-        # Stream the graph execution with messages mode for token streaming
-        async for event in self.graph.astream_events(initial_state, version="v2"):
+        # Stream the graph execution with messages mode for token streaming,
+        # buffered so the graph keeps producing while events are serialized
+        events = self.graph.astream_events(
+            initial_state, version="v2", include_types=_STREAM_EVENT_TYPES
+        )
+        async for event in buffered(events, _EVENT_BUFFER_SIZE):
             kind = event.get("event")
             
             # Token streaming from LLM
             if kind == "on_chat_model_stream":
-                chunk = event.get("data", {}).get("chunk")
-                if chunk and hasattr(chunk, "content") and chunk.content:
-                    yield {
-                        "type": "token",
-                        "content": chunk.content,
-                    }
+                match event.get("data", {}).get("chunk"):
+                    case AIMessageChunk(content=content) if content:
+                        yield {
+                            "type": "token",
+                            "content": content,
+                        }
             
             # Tool calls
             elif kind == "on_chat_model_end":
-                output = event.get("data", {}).get("output")
-                if output and hasattr(output, "tool_calls") and output.tool_calls:
-                    yield {
-                        "type": "tool_calls",
-                        "tool_calls": output.tool_calls,
-                    }
+                match event.get("data", {}).get("output"):
+                    case AIMessage(tool_calls=tool_calls) if tool_calls:
+                        yield {
+                            "type": "tool_calls",
+                            "tool_calls": tool_calls,
+                        }
             
             # Tool execution results
             elif kind == "on_tool_end":
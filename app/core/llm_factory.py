@@ -1,7 +1,9 @@
 """LLM factory for multi-provider support."""
 
-from typing import Literal
+from functools import lru_cache
+from typing import Any, Literal
 
+import httpx
 from langchain_core.language_models.chat_models import BaseChatModel
 from langchain_google_genai import ChatGoogleGenerativeAI
 from langchain_openai import ChatOpenAI
@@ -10,6 +12,56 @@ from loguru import logger
 from app.config import Settings
 
 
+# Connection limits for the HTTP clients shared by OpenAI-compatible models
+_HTTP_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=50)
+
+
+@lru_cache(maxsize=1)
+def _get_http_client() -> httpx.Client:
+    """Get the process-wide sync HTTP client for OpenAI-compatible models."""
+    return httpx.Client(limits=_HTTP_LIMITS)
+
+
+@lru_cache(maxsize=1)
+def _get_http_async_client() -> httpx.AsyncClient:
+    """Get the process-wide async HTTP client for OpenAI-compatible models."""
+    return httpx.AsyncClient(limits=_HTTP_LIMITS)
+
+
+@lru_cache(maxsize=8)
+def _build_llm(
+    llm_class: type[BaseChatModel], config: tuple[tuple[str, Any], ...]
+) -> BaseChatModel:
+    """Construct an LLM instance, reusing it for identical configurations.
+
+    Sharing instances lets requests reuse the underlying HTTP client and its
+    connection pool instead of building a new one per analysis.
+
+    Args:
+        llm_class: Chat model class to instantiate
+        config: Constructor keyword arguments as sorted (name, value) pairs
+
+    Returns:
+        Configured LLM instance
+    """
+    return llm_class(**dict(config))
+
+
+async def close_http_clients() -> None:
+    """Close the shared HTTP clients and drop the models built on them.
+
+    The async client is bound to the event loop it was first used on, so it
+    is closed at application shutdown and rebuilt for the next loop.
+    """
+    if _get_http_async_client.cache_info().currsize:
+        await _get_http_async_client().aclose()
+    if _get_http_client.cache_info().currsize:
+        _get_http_client().close()
+    _build_llm.cache_clear()
+    _get_http_async_client.cache_clear()
+    _get_http_client.cache_clear()
+
+
 class LLMFactory:
     """Factory for creating LLM instances based on provider."""
 
@@ -57,13 +109,15 @@ class LLMFactory:
             "api_key": settings.openai_api_key,
             "temperature": kwargs.get("temperature", 0.7),
             "streaming": kwargs.get("streaming", True),
+            "http_client": _get_http_client(),
+            "http_async_client": _get_http_async_client(),
         }
 
         if settings.openai_base_url:
             config["base_url"] = settings.openai_base_url
 
-        logger.debug(f"OpenAI config: {config}")
-        return ChatOpenAI(**config)
+        logger.debug("OpenAI config: {}", config)
+        return _build_llm(ChatOpenAI, tuple(sorted(config.items())))
 
     @staticmethod
     def _create_gemini(
@@ -80,8 +134,8 @@ class LLMFactory:
             "streaming": kwargs.get("streaming", True),
         }
 
-        logger.debug(f"Gemini config: {config}")
-        return ChatGoogleGenerativeAI(**config)
+        logger.debug("Gemini config: {}", config)
+        return _build_llm(ChatGoogleGenerativeAI, tuple(sorted(config.items())))
 
     @staticmethod
     def _create_openrouter(model: str, settings: Settings, **kwargs) -> ChatOpenAI:
@@ -95,10 +149,12 @@ class LLMFactory:
             "base_url": settings.openrouter_base_url,
             "temperature": kwargs.get("temperature", 0.7),
             "streaming": kwargs.get("streaming", True),
+            "http_client": _get_http_client(),
+            "http_async_client": _get_http_async_client(),
         }
 
-        logger.debug(f"OpenRouter config: {config}")
-        return ChatOpenAI(**config)
+        logger.debug("OpenRouter config: {}", config)
+        return _build_llm(ChatOpenAI, tuple(sorted(config.items())))
 
 
 def create_llm_from_settings(settings: Settings, **kwargs) -> BaseChatModel:
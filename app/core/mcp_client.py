@@ -1,14 +1,42 @@
 """MCP client setup for github-repo-mcp integration."""
 
+import asyncio
+import hashlib
+import shutil
 import sys
+import time
+from pathlib import Path
 from typing import Any
 
+import orjson
 from langchain_core.tools import BaseTool
 from langchain_mcp_adapters.client import MultiServerMCPClient
+from langchain_mcp_adapters.tools import convert_mcp_tool_to_langchain_tool
 from loguru import logger
+from mcp.types import Tool as MCPTool
 
 from app.config import Settings
 
+# Initialized clients shared across requests, keyed by (server, token)
+_CLIENT_CACHE: dict[tuple[str, str | None], "MCPClientManager"] = {}
+_CACHE_LOCK = asyncio.Lock()
+
+
+def _tool_descriptor(tool: BaseTool) -> dict[str, Any]:
+    """Describe an MCP-backed LangChain tool as MCP tool fields."""
+    schema = tool.args_schema
+    if not isinstance(schema, dict):
+        schema = schema.model_json_schema()
+    metadata = dict(tool.metadata or {})
+    meta = metadata.pop("_meta", None)
+    return {
+        "name": tool.name,
+        "description": tool.description,
+        "inputSchema": schema,
+        "annotations": metadata or None,
+        "_meta": meta,
+    }
+
 
 class MCPClientManager:
     """Manager for MCP client connections."""
@@ -22,6 +50,9 @@ class MCPClientManager:
         self.settings = settings
         self._client: MultiServerMCPClient | None = None
         self._tools: list[BaseTool] | None = None
+        # Set while the manager is shared through create_mcp_client
+        self._pooled = False
+        self._refcount = 0
 
     async def initialize(self) -> None:
         """Initialize MCP client and load tools."""
@@ -52,23 +83,89 @@ class MCPClientManager:
                 **server_config_base,
             }
 
-        logger.debug(f"MCP server config: {server_config}")
+        logger.debug("MCP server config: {}", server_config)
 
         # Create MultiServerMCPClient
         self._client = MultiServerMCPClient(
             {self.settings.mcp_server: server_config}
         )
 
-        # Load tools from MCP server
+        # Load tools from the descriptor cache, falling back to the MCP server
         try:
-            self._tools = await self._client.get_tools()
+            self._tools = await asyncio.to_thread(self._load_cached_tools, server_config)
+            if self._tools is None:
+                self._tools = await self._client.get_tools()
+                await asyncio.to_thread(self._store_tools, server_config, self._tools)
             logger.info(f"Loaded {len(self._tools)} tools from MCP server")
             for tool in self._tools:
-                logger.debug(f"  - {tool.name}: {tool.description}")
+                logger.debug("  - {}: {}", tool.name, tool.description)
         except Exception as e:
             logger.error(f"Failed to load MCP tools: {e}")
             raise
 
+    def _tool_cache_path(self, server_config: dict[str, Any]) -> Path:
+        """Get the descriptor cache file for a server configuration."""
+        key = orjson.dumps(
+            [self.settings.mcp_server, server_config], option=orjson.OPT_SORT_KEYS
+        )
+        digest = hashlib.blake2b(key, digest_size=8).hexdigest()
+        return self.settings.mcp_tool_cache_dir / f"tools-{digest}.json"
+
+    def _load_cached_tools(self, server_config: dict[str, Any]) -> list[BaseTool] | None:
+        """Rebuild tools from cached descriptors without contacting the server.
+
+        The cache is stale once it is older than the configured TTL or than
+        the server launcher binary.
+
+        Args:
+            server_config: MCP server connection configuration
+
+        Returns:
+            Tools bound to the server connection, or None on a cache miss
+        """
+        ttl = self.settings.mcp_tool_cache_ttl
+        if ttl <= 0:
+            return None
+
+        path = self._tool_cache_path(server_config)
+        try:
+            cached_at = path.stat().st_mtime
+            if time.time() - cached_at > ttl:
+                return None
+            launcher = shutil.which(server_config["command"])
+            if launcher and Path(launcher).stat().st_mtime > cached_at:
+                return None
+            descriptors = orjson.loads(path.read_bytes())
+            tools = [MCPTool.model_validate(descriptor) for descriptor in descriptors]
+        except (OSError, ValueError) as e:
+            logger.debug("MCP tool cache miss: {}", e)
+            return None
+
+        connection = self._client.connections[self.settings.mcp_server]
+        return [
+            convert_mcp_tool_to_langchain_tool(
+                None, tool, connection=connection, server_name=self.settings.mcp_server
+            )
+            for tool in tools
+        ]
+
+    def _store_tools(self, server_config: dict[str, Any], tools: list[BaseTool]) -> None:
+        """Write tool descriptors to the cache, ignoring write failures.
+
+        Args:
+            server_config: MCP server connection configuration
+            tools: Tools loaded from the MCP server
+        """
+        if self.settings.mcp_tool_cache_ttl <= 0:
+            return
+
+        path = self._tool_cache_path(server_config)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_bytes(orjson.dumps([_tool_descriptor(tool) for tool in tools]))
+        except OSError as e:
+            logger.warning(f"Failed to cache MCP tool descriptors: {e}")
+
     async def get_tools(self) -> list[BaseTool]:
         """Get loaded MCP tools.
 
@@ -83,7 +180,15 @@ class MCPClientManager:
         return self._tools
 
     async def close(self) -> None:
-        """Close MCP client connections."""
+        """Close MCP client connections.
+
+        Pooled clients handed out by create_mcp_client are only released
+        here; they stay connected until close_mcp_clients() is called.
+        """
+        if self._pooled:
+            self._refcount = max(self._refcount - 1, 0)
+            return
+
         if self._client is not None:
             logger.info("Closing MCP client")
             # Note: MultiServerMCPClient doesn't have explicit close method
@@ -102,7 +207,12 @@ class MCPClientManager:
 
 
 async def create_mcp_client(settings: Settings) -> MCPClientManager:
-    """Create and initialize MCP client manager.
+    """Get an initialized MCP client manager, reusing a pooled one if possible.
+
+    Managers are shared across callers with the same server and GitHub
+    token. Calling close() on the returned manager releases it without
+    disconnecting. The stdio transport opens a fresh server session per
+    call, so a pooled manager holds no connection that can go stale.
 
     Args:
         settings: Application settings
@@ -110,6 +220,24 @@ async def create_mcp_client(settings: Settings) -> MCPClientManager:
     Returns:
         Initialized MCP client manager
     """
-    manager = MCPClientManager(settings)
-    await manager.initialize()
+    key = (settings.mcp_server, settings.github_token)
+    async with _CACHE_LOCK:
+        manager = _CLIENT_CACHE.get(key)
+        if manager is None:
+            manager = MCPClientManager(settings)
+            await manager.initialize()
+            manager._pooled = True
+            _CLIENT_CACHE[key] = manager
+        manager._refcount += 1
     return manager
+
+
+async def close_mcp_clients() -> None:
+    """Disconnect and drop all pooled MCP client managers."""
+    async with _CACHE_LOCK:
+        managers = list(_CLIENT_CACHE.values())
+        _CLIENT_CACHE.clear()
+    for manager in managers:
+        manager._pooled = False
+        manager._refcount = 0
+        await manager.close()
@@ -0,0 +1,109 @@
+"""Async streaming utilities."""
+
+import asyncio
+from typing import AsyncIterator, TypeVar
+
+T = TypeVar("T")
+
+# Marks the end of the source iterator in the buffer queue
+_DONE = object()
+
+
+def _drain_into(iterator: AsyncIterator[T], queue: asyncio.Queue) -> asyncio.Task:
+    """Start a task that moves every item of an iterator into a queue.
+
+    The whole source iterator runs inside the returned task, followed by a
+    ``_DONE`` marker once it is exhausted or fails. Cancelling the task closes
+    the source iterator instead.
+    """
+
+    async def produce() -> None:
+        try:
+            async for item in iterator:
+                await queue.put(item)
+        except asyncio.CancelledError:
+            # The consumer stopped reading, so a marker could block forever
+            # on a full queue; close the source and skip it
+            if hasattr(iterator, "aclose"):
+                await iterator.aclose()
+            raise
+        except Exception:
+            await queue.put(_DONE)
+            raise
+        await queue.put(_DONE)
+
+    return asyncio.create_task(produce())
+
+
+async def _stop(producer: asyncio.Task) -> None:
+    """Cancel a producer task and wait until it has finished.
+
+    Only the producer's own cancellation is absorbed; a cancellation of the
+    calling task still propagates.
+    """
+    producer.cancel()
+    await asyncio.wait({producer})
+    if not producer.cancelled():
+        # Mark a late source error as retrieved; the consumer already left
+        producer.exception()
+
+
+async def buffered(iterator: AsyncIterator[T], size: int) -> AsyncIterator[T]:
+    """Read ahead from an async iterator in a background task.
+
+    The source iterator keeps producing up to ``size`` items while the
+    consumer is busy handling the current one, so both sides can overlap.
+
+    Args:
+        iterator: Source async iterator
+        size: Maximum number of items buffered ahead of the consumer
+
+    Yields:
+        Items from the source iterator, in order
+
+    Raises:
+        Exception: Any exception raised by the source iterator
+    """
+    queue: asyncio.Queue = asyncio.Queue(maxsize=size)
+    producer = _drain_into(iterator, queue)
+    try:
+        while (item := await queue.get()) is not _DONE:
+            yield item
+        # Re-raise any error from the source iterator
+        await producer
+    finally:
+        await _stop(producer)
+
+
+async def with_heartbeat(
+    iterator: AsyncIterator[T], interval: float, heartbeat: T
+) -> AsyncIterator[T]:
+    """Interleave a heartbeat item whenever the source iterator goes idle.
+
+    Args:
+        iterator: Source async iterator
+        interval: Seconds without a source item before a heartbeat is yielded
+        heartbeat: Item yielded on each idle interval
+
+    Yields:
+        Items from the source iterator, interleaved with heartbeats
+
+    Raises:
+        Exception: Any exception raised by the source iterator
+    """
+    queue: asyncio.Queue = asyncio.Queue(maxsize=1)
+    producer = _drain_into(iterator, queue)
+    try:
+        while True:
+            try:
+                item = await asyncio.wait_for(queue.get(), timeout=interval)
+            except asyncio.TimeoutError:
+                yield heartbeat
+                continue
+            if item is _DONE:
+                break
+            yield item
+        # Re-raise any error from the source iterator
+        await producer
+    finally:
+        await _stop(producer)
@@ -1,14 +1,19 @@
 """FastAPI application entry point."""
 
+import sys
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
-from fastapi.middleware.cors import CORSMiddleware
 from loguru import logger
 
 from app import __version__
+from app.api.middleware import CORSMiddleware
 from app.api.routes import router
 from app.config import get_settings
+from app.core.llm_factory import close_http_clients
+from app.core.mcp_client import close_mcp_clients
+from app.prompts.base import get_prompt_loader
+from app.services.analyzer import create_analyzer
 
 
 @asynccontextmanager
@@ -16,21 +21,37 @@ async def lifespan(app: FastAPI):
     """Application lifespan manager."""
     settings = get_settings()
 
-    # Configure loguru
+    # Configure loguru; enqueue so formatting and writes happen off the event loop
     logger.remove()  # Remove default handler
     logger.add(
-        sink=lambda msg: print(msg, end=""),
+        sys.stdout,
         level=settings.log_level,
         format="<green>{time:YYYY-MM-DD HH:mm:ss}</green> | <level>{level: <8}</level> | <cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> - <level>{message}</level>",
+        enqueue=True,
+        backtrace=False,
+        diagnose=False,
     )
 
+    # Create the report output directory once at startup
+    settings.report_output_dir.mkdir(parents=True, exist_ok=True)
+
+    # Parse prompt templates before the first request needs them
+    await get_prompt_loader().warm()
+
     logger.info(f"Starting {settings.app_name} v{__version__}")
     logger.info(f"LLM Provider: {settings.llm_provider}")
     logger.info(f"LLM Model: {settings.llm_model}")
 
-    yield
+    # Build the LLM, MCP client and agent up front so the first analysis
+    # request does not pay for spawning the MCP server
+    async with create_analyzer(settings) as analyzer:
+        app.state.analyzer = analyzer
+        yield
 
     logger.info(f"Shutting down {settings.app_name}")
+    await close_mcp_clients()
+    await close_http_clients()
+    await logger.complete()
 
 
 def create_app() -> FastAPI:
@@ -45,13 +66,7 @@ def create_app() -> FastAPI:
     )
 
     # CORS middleware
-    app.add_middleware(
-        CORSMiddleware,
-        allow_origins=["*"],
-        allow_credentials=True,
-        allow_methods=["*"],
-        allow_headers=["*"],
-    )
+    app.add_middleware(CORSMiddleware)
 
     # Include routers
     app.include_router(router)
@@ -66,10 +81,16 @@ if __name__ == "__main__":
     import uvicorn
 
     settings = get_settings()
+    # uvicorn[standard] provides uvloop and httptools; request access logs
+    # are off by default since every SSE chunk would otherwise be a write
     uvicorn.run(
         "app.main:app",
         host=settings.host,
         port=settings.port,
-        reload=True,
+        loop="auto",
+        http="httptools",
+        reload=settings.reload,
+        workers=settings.workers,
+        access_log=settings.access_log,
         log_level=settings.log_level.lower(),
     )
@@ -1,11 +1,19 @@
 """Prompt loading and management utilities."""
 
+import asyncio
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
 import yaml
-from jinja2 import Template
-from pydantic import BaseModel, Field
+from jinja2 import Environment, Template
+from pydantic import BaseModel, Field, PrivateAttr
+
+# Prefer the libyaml-backed loader when PyYAML was built with it
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Shared Jinja2 environment; templates are compiled once per PromptTemplate
+_jinja_env = Environment(autoescape=False, auto_reload=False)
 
 
 class PromptTemplate(BaseModel):
@@ -17,14 +25,43 @@ class PromptTemplate(BaseModel):
     template: str = Field(..., description="Jinja2 template string")
     variables: list[str] = Field(default_factory=list, description="Required variables")
 
+    _compiled: Template = PrivateAttr()
+    _required_vars: frozenset[str] = PrivateAttr()
+
+    def model_post_init(self, __context: Any) -> None:
+        """Compile the Jinja2 template once at construction."""
+        self._compiled = _jinja_env.from_string(self.template)
+        self._required_vars = frozenset(self.variables)
+
     def render(self, **kwargs: Any) -> str:
         """Render the template with provided variables."""
-        missing_vars = set(self.variables) - set(kwargs.keys())
+        missing_vars = self._required_vars - kwargs.keys()
         if missing_vars:
-            raise ValueError(f"Missing required variables: {missing_vars}")
+            raise ValueError(f"Missing required variables: {set(missing_vars)}")
+
+        return self._compiled.render(**kwargs)
 
-        jinja_template = Template(self.template)
-        return jinja_template.render(**kwargs)
+
+@lru_cache(maxsize=None)
+def _load_template(template_path: Path) -> PromptTemplate:
+    """Read and compile a template file, shared by every loader in the process.
+
+    Args:
+        template_path: Path to the template YAML file
+
+    Returns:
+        Loaded prompt template
+
+    Raises:
+        FileNotFoundError: If template file doesn't exist
+    """
+    try:
+        with open(template_path, "r", encoding="utf-8") as f:
+            data = yaml.load(f, Loader=_YamlLoader)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Template not found: {template_path}") from None
+
+    return PromptTemplate(**data)
 
 
 class PromptLoader:
@@ -58,17 +95,30 @@ class PromptLoader:
         if template_name in self._cache:
             return self._cache[template_name]
 
-        template_path = self.templates_dir / f"{template_name}.yaml"
-        if not template_path.exists():
-            raise FileNotFoundError(f"Template not found: {template_path}")
-
-        with open(template_path, "r", encoding="utf-8") as f:
-            data = yaml.safe_load(f)
-
-        template = PromptTemplate(**data)
+        template = _load_template(self.templates_dir / f"{template_name}.yaml")
         self._cache[template_name] = template
         return template
 
+    async def aload(self, template_name: str) -> PromptTemplate:
+        """Load a prompt template without blocking the event loop.
+
+        Cached templates are returned directly; otherwise the file is read
+        and parsed in a worker thread.
+
+        Args:
+            template_name: Name of the template file (without .yaml extension)
+
+        Returns:
+            Loaded prompt template
+
+        Raises:
+            FileNotFoundError: If template file doesn't exist
+            ValueError: If template YAML is invalid
+        """
+        if template_name in self._cache:
+            return self._cache[template_name]
+        return await asyncio.to_thread(self.load, template_name)
+
     def render(self, template_name: str, **kwargs: Any) -> str:
         """Load and render a template in one step.
 
@@ -82,18 +132,22 @@ class PromptLoader:
         template = self.load(template_name)
         return template.render(**kwargs)
 
-    def clear_cache(self) -> None:
-        """Clear the template cache."""
-        self._cache.clear()
+    async def warm(self) -> None:
+        """Load every template in the templates directory into the cache.
 
+        Templates are parsed in worker threads so startup does not block the
+        event loop; afterwards load() is a cache lookup.
+        """
+        template_names = [path.stem for path in self.templates_dir.glob("*.yaml")]
+        await asyncio.gather(*(self.aload(name) for name in template_names))
 
-# Global prompt loader instance
-_prompt_loader: PromptLoader | None = None
+    def clear_cache(self) -> None:
+        """Clear the template cache, including templates shared across loaders."""
+        self._cache.clear()
+        _load_template.cache_clear()
 
 
+@lru_cache
 def get_prompt_loader() -> PromptLoader:
     """Get the global prompt loader instance."""
-    global _prompt_loader
-    if _prompt_loader is None:
-        _prompt_loader = PromptLoader()
-    return _prompt_loader
+    return PromptLoader()
@@ -1,9 +1,11 @@
 """Repository analyzer service with SSE streaming support."""
 
-import json
-from datetime import datetime, timezone
-from typing import AsyncGenerator
+import time
+from datetime import datetime, timedelta, timezone
+from types import MappingProxyType
+from typing import Any, AsyncGenerator, Callable, Mapping, NamedTuple, Sequence
 
+import orjson
 from loguru import logger
 
 from app.config import Settings, get_settings
@@ -11,39 +13,148 @@ from app.core.agent import create_analysis_agent
 from app.core.llm_factory import create_llm_from_settings
 from app.core.mcp_client import create_mcp_client
 
+# Serialize event timestamps as ISO 8601 UTC with a "Z" suffix
+_SSE_JSON_OPTIONS = orjson.OPT_UTC_Z
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+# Pre-encoded SSE framing for token events, the bulk of every stream
+_TOKEN_EVENT_PREFIX = b'data: {"type":"token","data":{"content":'
+_TOKEN_EVENT_TIMESTAMP = b'},"timestamp":'
+_SSE_EVENT_SUFFIX = b"}\n\n"
+
+# Progress message prefixes for tools that operate on a repository path
+_PATH_TOOL_MESSAGES = {
+    "read_file": "IsAnalyzingFile",
+    "list_directory": "IsListingDirectory",
+}
+
+# Progress messages for tools without a path argument
+_TOOL_MESSAGES = {
+    "get_repo_structure": "IsGettingRepoStructure",
+}
+
+
+# Shared arguments for tool calls that carry none
+_NO_ARGS: Mapping[str, Any] = MappingProxyType({})
+
+
+class _ToolCall(NamedTuple):
+    """Fields of a LangChain tool call dict used for progress events."""
+
+    name: str
+    args: Mapping[str, Any]
+
+
+def _as_tool_call(tool_call: dict) -> _ToolCall:
+    """View a LangChain tool call dict as a ``_ToolCall``."""
+    return _ToolCall(tool_call.get("name"), tool_call.get("args") or _NO_ARGS)
+
+
+def _tool_call_message(tool_name: str, args: Mapping[str, Any]) -> str:
+    """Build the progress message for a tool call.
+
+    Args:
+        tool_name: Name of the tool being called
+        args: Tool call arguments
+
+    Returns:
+        Progress message key, with the path appended for path-based tools
+    """
+    prefix = _PATH_TOOL_MESSAGES.get(tool_name)
+    if prefix and "path" in args:
+        return f"{prefix} {args['path']}"
+    return _TOOL_MESSAGES.get(tool_name) or f"IsExecuting {tool_name}"
+
 
 class AnalysisEvent:
     """Analysis event for SSE streaming."""
 
+    __slots__ = ("event_type", "data", "timestamp")
+
     def __init__(
         self,
         event_type: str,
         data: dict,
-        timestamp: datetime | None = None,
+        timestamp: int | None = None,
     ):
         """Initialize analysis event.
 
         Args:
             event_type: Type of event (e.g., 'progress', 'tool_call', 'result')
             data: Event data
-            timestamp: Event timestamp (defaults to now)
+            timestamp: Event time in nanoseconds since the epoch (defaults to now)
         """
         self.event_type = event_type
         self.data = data
-        self.timestamp = timestamp or datetime.now(timezone.utc)
+        self.timestamp = timestamp if timestamp is not None else time.time_ns()
 
-    def to_sse_format(self) -> str:
+    def to_sse_format(self) -> bytes:
         """Convert event to SSE format.
 
         Returns:
-            SSE-formatted string
+            UTF-8 encoded SSE message, ready to be written to the response
         """
+        timestamp = _EPOCH + timedelta(microseconds=self.timestamp // 1000)
+
+        # Token events only carry content; frame them without building a dict
+        if self.event_type == "token" and len(self.data) == 1 and "content" in self.data:
+            return b"".join(
+                (
+                    _TOKEN_EVENT_PREFIX,
+                    orjson.dumps(self.data["content"]),
+                    _TOKEN_EVENT_TIMESTAMP,
+                    orjson.dumps(timestamp, option=_SSE_JSON_OPTIONS),
+                    _SSE_EVENT_SUFFIX,
+                )
+            )
+
         event_data = {
             "type": self.event_type,
             "data": self.data,
-            "timestamp": self.timestamp.isoformat().replace("+00:00", "Z"),
+            "timestamp": timestamp,
         }
-        return f"data: {json.dumps(event_data)}\n\n"
+        return b"data: " + orjson.dumps(event_data, option=_SSE_JSON_OPTIONS) + b"\n\n"
+
+
+def _token_events(event: dict) -> Sequence[AnalysisEvent]:
+    """Convert an LLM token event."""
+    if content := event.get("content"):
+        return (AnalysisEvent(event_type="token", data={"content": content}),)
+    return ()
+
+
+def _tool_call_events(event: dict) -> Sequence[AnalysisEvent]:
+    """Convert an LLM tool calls event, one analysis event per call."""
+    return [
+        AnalysisEvent(
+            event_type="tool_call",
+            data={
+                "message": _tool_call_message(tool_call.name, tool_call.args),
+                "tool": tool_call.name,
+            },
+        )
+        for tool_call in map(_as_tool_call, event.get("tool_calls", ()))
+    ]
+
+
+def _tool_result_events(event: dict) -> Sequence[AnalysisEvent]:
+    """Convert a tool execution result event."""
+    if tool_name := event.get("name"):
+        return (
+            AnalysisEvent(
+                event_type="tool_result",
+                data={"message": f"Completed {tool_name}", "tool": tool_name},
+            ),
+        )
+    return ()
+
+
+# Converters from agent stream events to analysis events, keyed by event type
+_EVENT_HANDLERS: dict[str, Callable[[dict], Sequence[AnalysisEvent]]] = {
+    "token": _token_events,
+    "tool_calls": _tool_call_events,
+    "tool_result": _tool_result_events,
+}
 
 
 class RepositoryAnalyzer:
@@ -130,52 +241,11 @@ class RepositoryAnalyzer:
         try:
             # Stream analysis events
             async for event in self._agent.stream_analysis(repo_url, language=language):
-                event_type = event.get("type")
-                
-                # Token-level streaming from LLM
-                if event_type == "token":
-                    content = event.get("content", "")
-                    if content:
-                        yield AnalysisEvent(
-                            event_type="token",
-                            data={"content": content},
-                        )
-                
-                # Tool calls
-                elif event_type == "tool_calls":
-                    tool_calls = event.get("tool_calls", [])
-                    for tool_call in tool_calls:
-                        tool_name = tool_call.get("name")
-                        args = tool_call.get("args", {})
-                        
-                        if tool_name == "read_file" and "path" in args:
-                            message = f"IsAnalyzingFile {args['path']}"
-                        elif tool_name == "list_directory" and "path" in args:
-                            message = f"IsListingDirectory {args['path']}"
-                        elif tool_name == "get_repo_structure":
-                            message = f"IsGettingRepoStructure"
-                        else:
-                            message = f"IsExecuting {tool_name}"
-                        
-                        yield AnalysisEvent(
-                            event_type="tool_call",
-                            data={
-                                "message": message,
-                                "tool": tool_name,
-                            },
-                        )
-                
-                # Tool execution results
-                elif event_type == "tool_result":
-                    tool_name = event.get("name")
-                    if tool_name:
-                        yield AnalysisEvent(
-                            event_type="tool_result",
-                            data={
-                                "message": f"Completed {tool_name}",
-                                "tool": tool_name,
-                            },
-                        )
+                handler = _EVENT_HANDLERS.get(event.get("type"))
+                if handler is None:
+                    continue
+                for analysis_event in handler(event):
+                    yield analysis_event
 
             # Send completion event
             yield AnalysisEvent(
@@ -194,7 +264,11 @@ class RepositoryAnalyzer:
             raise
 
     async def close(self) -> None:
-        """Close analyzer and cleanup resources."""
+        """Close analyzer and cleanup resources.
+
+        The MCP client is released back to the shared pool; pooled
+        connections are closed on application shutdown.
+        """
         logger.info("Closing repository analyzer")
         if self._mcp_client:
             await self._mcp_client.close()
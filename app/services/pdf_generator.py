@@ -1,74 +1,206 @@
 """PDF report generation service using ReportLab."""
 
+import asyncio
+import html
+import os
+import re
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
+from typing import Any, Iterator
 
-import markdown
 from loguru import logger
+from reportlab import rl_config
 from reportlab.lib import colors
 from reportlab.lib.pagesizes import A4
-from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
+from reportlab.lib.styles import ParagraphStyle, StyleSheet1, getSampleStyleSheet
 from reportlab.lib.units import cm
-from reportlab.platypus import Paragraph, SimpleDocTemplate, Spacer, Table, TableStyle
+from reportlab.pdfbase.pdfmetrics import stringWidth
+from reportlab.platypus import (
+    Flowable,
+    Paragraph,
+    Preformatted,
+    SimpleDocTemplate,
+    Spacer,
+    Table,
+    TableStyle,
+)
+
+# Skip ReportLab's shape attribute validation unless explicitly requested
+# through its RL_shapeChecking environment variable
+if "RL_shapeChecking" not in os.environ:
+    rl_config.shapeChecking = 0
+
+# Body line tokens: HTML special characters, inline code and bold text
+_INLINE_RE = re.compile(r"[&<>]|`([^`]+)`|\*\*([^*]+)\*\*")
+_HTML_ESCAPES = {"&": "&amp;", "<": "&lt;", ">": "&gt;"}
+_INLINE_CODE_FORMAT = '<font face="Courier" size="9" color="#c0392b">{}</font>'
+
+# Paragraph styles for markdown header markers
+_HEADER_STYLES = {"#": "Heading1", "##": "CustomHeading2", "###": "Heading3"}
+
+# Markers that start a bullet list item
+_BULLET_MARKERS = frozenset({"-", "*"})
+
+# Page layout for the WeasyPrint backend, mirroring the Platypus styles
+_HTML_REPORT_CSS = """
+@page { size: A4; margin: 2cm; }
+body { font-family: Helvetica, Arial, sans-serif; font-size: 11pt; line-height: 1.45; }
+h1.title { font-size: 24pt; color: #2c3e50; margin-bottom: 20px; }
+h2 { font-size: 16pt; color: #34495e; margin-top: 20px; }
+table.meta { font-size: 10pt; margin-bottom: 20px; }
+table.meta th { text-align: left; color: #555555; padding: 4px 24px 8px 0; }
+code { font-family: Courier, monospace; font-size: 9pt; color: #c0392b; }
+pre { background: #f4f4f4; padding: 8px 10px; font-size: 9pt; }
+pre code { color: inherit; }
+"""
+
+_HTML_REPORT_TEMPLATE = """<!DOCTYPE html>
+<html>
+<head><meta charset="utf-8"><style>{css}</style></head>
+<body>
+<h1 class="title">{project_name} - Repository Analysis</h1>
+<table class="meta">
+<tr><th>Repository URL</th><td>{repo_url}</td></tr>
+<tr><th>Generated</th><td>{generated}</td></tr>
+<tr><th>Analyzer</th><td>GitHub Repository Lens</td></tr>
+</table>
+{body}
+</body>
+</html>
+"""
+
+# Markdown extensions used when rendering the report body to HTML
+_MARKDOWN_EXTENSIONS = ["fenced_code", "tables"]
+
+
+@lru_cache(maxsize=1)
+def _load_weasyprint() -> Any:
+    """Import WeasyPrint's HTML class, or return None if it is unavailable."""
+    try:
+        from weasyprint import HTML
+    except (ImportError, OSError) as e:
+        logger.warning(f"WeasyPrint unavailable, falling back to ReportLab: {e}")
+        return None
+    return HTML
+
+
+def _refuse_url(url: str) -> dict:
+    """WeasyPrint URL fetcher that blocks every external resource.
+
+    Report content comes from analyzed repositories, so embedded links to
+    images or local files must not be fetched while rendering.
+    """
+    raise ValueError(f"External resources are disabled in reports: {url}")
+
+
+def _escape_html(text: str) -> str:
+    """Escape HTML special characters for ReportLab."""
+    return text.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+
+
+def _replace_inline(match: re.Match) -> str:
+    """Render one inline token matched by ``_INLINE_RE``."""
+    code, bold = match.groups()
+    if code is not None:
+        return _INLINE_CODE_FORMAT.format(_escape_html(code))
+    if bold is not None:
+        return f"<b>{_INLINE_RE.sub(_replace_inline, bold)}</b>"
+    return _HTML_ESCAPES[match[0]]
+
+
+def _build_styles() -> StyleSheet1:
+    """Build the sample stylesheet extended with the report styles."""
+    styles = getSampleStyleSheet()
+    styles.add(
+        ParagraphStyle(
+            "CustomTitle",
+            parent=styles["Heading1"],
+            fontSize=24,
+            spaceAfter=20,
+            textColor=colors.HexColor("#2c3e50"),
+        )
+    )
+    styles.add(
+        ParagraphStyle(
+            "CustomHeading2",
+            parent=styles["Heading2"],
+            fontSize=16,
+            spaceBefore=20,
+            spaceAfter=10,
+            textColor=colors.HexColor("#34495e"),
+        )
+    )
+    styles.add(
+        ParagraphStyle(
+            "CustomBody",
+            parent=styles["Normal"],
+            fontSize=11,
+            leading=16,
+            spaceAfter=8,
+        )
+    )
+    styles.add(
+        ParagraphStyle(
+            "CodeBlock",
+            parent=styles["Code"],
+            fontSize=9,
+            leading=12,
+            backColor=colors.HexColor("#f4f4f4"),
+            leftIndent=10,
+            rightIndent=10,
+            spaceBefore=8,
+            spaceAfter=8,
+        )
+    )
+    return styles
+
+
+# Report styles, built once per process and shared by every generator
+_STYLES = _build_styles()
+
+
+def _code_line_chars(style: ParagraphStyle) -> int:
+    """Count the monospaced characters that fit on one line of a code block.
+
+    The width available is the A4 page less the 2cm margins, the frame's
+    6pt padding on each side, and the style's indents.
+    """
+    width = A4[0] - 4 * cm - 12 - style.leftIndent - style.rightIndent
+    return int(width // stringWidth(" ", style.fontName, style.fontSize))
+
+
+# Longest code line drawn before wrapping; Preformatted never wraps itself
+_CODE_LINE_CHARS = _code_line_chars(_STYLES["CodeBlock"])
+
+# Prefix of wrapped code line continuations
+_CODE_CONTINUATION = "  "
+
+
+def _code_block(code_lines: list[str]) -> Preformatted:
+    """Render fenced code verbatim, wrapping lines wider than the page."""
+    return Preformatted(
+        "\n".join(code_lines),
+        _STYLES["CodeBlock"],
+        maxLineLength=_CODE_LINE_CHARS,
+        newLineChars=_CODE_CONTINUATION,
+    )
 
 
 class PDFReportGenerator:
     """Generate PDF reports from analysis results."""
 
-    def __init__(self, output_dir: Path):
+    def __init__(self, output_dir: Path, backend: str = "reportlab"):
         """Initialize PDF report generator.
 
         Args:
             output_dir: Directory to save generated PDFs
+            backend: Rendering backend, "reportlab" or "weasyprint"
         """
         self.output_dir = Path(output_dir)
+        self.backend = backend
         self.output_dir.mkdir(parents=True, exist_ok=True)
-        self.styles = getSampleStyleSheet()
-        self._setup_custom_styles()
-
-    def _setup_custom_styles(self):
-        """Setup custom paragraph styles."""
-        self.styles.add(
-            ParagraphStyle(
-                "CustomTitle",
-                parent=self.styles["Heading1"],
-                fontSize=24,
-                spaceAfter=20,
-                textColor=colors.HexColor("#2c3e50"),
-            )
-        )
-        self.styles.add(
-            ParagraphStyle(
-                "CustomHeading2",
-                parent=self.styles["Heading2"],
-                fontSize=16,
-                spaceBefore=20,
-                spaceAfter=10,
-                textColor=colors.HexColor("#34495e"),
-            )
-        )
-        self.styles.add(
-            ParagraphStyle(
-                "CustomBody",
-                parent=self.styles["Normal"],
-                fontSize=11,
-                leading=16,
-                spaceAfter=8,
-            )
-        )
-        self.styles.add(
-            ParagraphStyle(
-                "CodeBlock",
-                parent=self.styles["Code"],
-                fontSize=9,
-                leading=12,
-                backColor=colors.HexColor("#f4f4f4"),
-                leftIndent=10,
-                rightIndent=10,
-                spaceBefore=8,
-                spaceAfter=8,
-            )
-        )
+        self.styles = _STYLES
 
     def generate(
         self,
@@ -92,40 +224,86 @@ class PDFReportGenerator:
 
         messages = analysis_result.get("messages", [])
         analysis_content = self._extract_analysis_content(messages)
+        # One timestamp for both the filename and the report header
+        now = datetime.now()
 
         if output_filename is None:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            timestamp = now.strftime("%Y%m%d_%H%M%S")
             output_filename = f"{project_name}_{timestamp}.pdf"
 
         output_path = self.output_dir / output_filename
 
-        doc = SimpleDocTemplate(
-            str(output_path),
-            pagesize=A4,
-            rightMargin=2 * cm,
-            leftMargin=2 * cm,
-            topMargin=2 * cm,
-            bottomMargin=2 * cm,
-        )
+        html_renderer = _load_weasyprint() if self.backend == "weasyprint" else None
+        if html_renderer is not None:
+            report_html = self._build_html(repo_url, project_name, analysis_content, now)
+            html_renderer(string=report_html, url_fetcher=_refuse_url).write_pdf(output_path)
+        else:
+            doc = SimpleDocTemplate(
+                str(output_path),
+                pagesize=A4,
+                rightMargin=2 * cm,
+                leftMargin=2 * cm,
+                topMargin=2 * cm,
+                bottomMargin=2 * cm,
+            )
 
-        story = self._build_story(repo_url, project_name, analysis_content)
-        doc.build(story)
+            story = self._build_story(repo_url, project_name, analysis_content, now)
+            doc.build(story)
 
         logger.info(f"PDF report generated successfully: {output_path}")
         return output_path
 
+    async def generate_async(
+        self,
+        analysis_result: dict,
+        repo_url: str,
+        project_name: str,
+        output_filename: str | None = None,
+    ) -> Path:
+        """Generate a PDF report in a worker thread.
+
+        Rendering is CPU-bound, so it runs off the event loop to let async
+        callers produce small reports without going through Celery.
+
+        Args:
+            analysis_result: Analysis result data
+            repo_url: GitHub repository URL
+            project_name: Project name for the report
+            output_filename: Optional custom output filename
+
+        Returns:
+            Path to generated PDF file
+        """
+        return await asyncio.to_thread(
+            self.generate, analysis_result, repo_url, project_name, output_filename
+        )
+
     def _extract_analysis_content(self, messages: list) -> str:
         """Extract analysis content from messages."""
-        content_parts = []
-        for message in messages:
-            if hasattr(message, "content"):
-                content = message.content
-                if isinstance(content, str) and content.strip():
-                    content_parts.append(content)
-        return "\n\n".join(content_parts)
+        return "\n\n".join(
+            content
+            for message in messages
+            if isinstance(content := getattr(message, "content", None), str)
+            and content.strip()
+        )
+
+    def _build_html(
+        self, repo_url: str, project_name: str, analysis_content: str, now: datetime
+    ) -> str:
+        """Build the report as an HTML document for the WeasyPrint backend."""
+        # Only needed by this backend, so keep it out of module import
+        import markdown
+
+        return _HTML_REPORT_TEMPLATE.format(
+            css=_HTML_REPORT_CSS,
+            project_name=html.escape(project_name),
+            repo_url=html.escape(repo_url),
+            generated=now.strftime("%Y-%m-%d %H:%M:%S"),
+            body=markdown.markdown(analysis_content, extensions=_MARKDOWN_EXTENSIONS),
+        )
 
     def _build_story(
-        self, repo_url: str, project_name: str, analysis_content: str
+        self, repo_url: str, project_name: str, analysis_content: str, now: datetime
     ) -> list:
         """Build PDF story (content elements)."""
         story = []
@@ -139,7 +317,7 @@ class PDFReportGenerator:
         # Metadata table
         meta_data = [
             ["Repository URL", repo_url],
-            ["Generated", datetime.now().strftime("%Y-%m-%d %H:%M:%S")],
+            ["Generated", now.strftime("%Y-%m-%d %H:%M:%S")],
             ["Analyzer", "GitHub Repository Lens"],
         ]
         meta_table = Table(meta_data, colWidths=[4 * cm, 12 * cm])
@@ -157,80 +335,72 @@ class PDFReportGenerator:
         story.append(meta_table)
         story.append(Spacer(1, 20))
 
-        # Analysis content
+        # Analysis content, appended as it is parsed
         story.extend(self._parse_markdown_content(analysis_content))
 
         return story
 
-    def _parse_markdown_content(self, content: str) -> list:
-        """Parse markdown content into PDF elements."""
-        elements = []
+    def _parse_markdown_content(self, content: str) -> Iterator[Flowable]:
+        """Parse markdown content into PDF elements, one line at a time.
+
+        Consecutive body lines are joined into a single paragraph so that
+        Platypus lays out one flowable per block of prose.
+        """
+        code_lines: list[str] | None = None
+        body_lines: list[str] = []
+
+        for raw_line in content.splitlines():
+            line = raw_line.strip()
+            is_fence = line.startswith("```")
 
-        for line in content.split("\n"):
-            line = line.strip()
-            if not line:
-                elements.append(Spacer(1, 6))
+            if code_lines is not None and not is_fence:
+                code_lines.append(raw_line)
                 continue
 
-            # Handle headers
-            if line.startswith("### "):
-                elements.append(
-                    Paragraph(line[4:], self.styles["Heading3"])
-                )
-            elif line.startswith("## "):
-                elements.append(
-                    Paragraph(line[3:], self.styles["CustomHeading2"])
-                )
-            elif line.startswith("# "):
-                elements.append(
-                    Paragraph(line[2:], self.styles["Heading1"])
-                )
-            elif line.startswith("```"):
+            # Dispatch headers and bullets on the leading marker
+            marker, _, text = line.partition(" ")
+            header_style = _HEADER_STYLES.get(marker) if text else None
+            is_bullet = bool(text) and marker in _BULLET_MARKERS
+
+            if line and not (is_fence or header_style or is_bullet):
+                # Regular text - escape HTML and format inline markdown in one pass
+                body_lines.append(_INLINE_RE.sub(_replace_inline, line))
                 continue
-            elif line.startswith("- ") or line.startswith("* "):
-                bullet_text = f"• {self._escape_html(line[2:])}"
-                elements.append(Paragraph(bullet_text, self.styles["CustomBody"]))
-            else:
-                # Regular paragraph - escape HTML special chars
-                safe_text = self._escape_html(line)
-                # Handle inline code
-                safe_text = self._format_inline_code(safe_text)
-                # Handle bold
-                safe_text = self._format_bold(safe_text)
-                elements.append(Paragraph(safe_text, self.styles["CustomBody"]))
-
-        return elements
-
-    def _escape_html(self, text: str) -> str:
-        """Escape HTML special characters for ReportLab."""
-        return (
-            text.replace("&", "&amp;")
-            .replace("<", "&lt;")
-            .replace(">", "&gt;")
-        )
 
-    def _format_inline_code(self, text: str) -> str:
-        """Format inline code with monospace font."""
-        import re
-        return re.sub(
-            r"`([^`]+)`",
-            r'<font face="Courier" size="9" color="#c0392b">\1</font>',
-            text,
-        )
+            # Anything else ends the current paragraph
+            if body_lines:
+                yield Paragraph("<br/>".join(body_lines), self.styles["CustomBody"])
+                body_lines = []
+
+            # Fenced code blocks are collected and rendered verbatim
+            if is_fence:
+                if code_lines is None:
+                    code_lines = []
+                else:
+                    yield _code_block(code_lines)
+                    code_lines = None
+            elif not line:
+                yield Spacer(1, 6)
+            elif header_style:
+                yield Paragraph(text, self.styles[header_style])
+            else:
+                yield Paragraph(f"• {_escape_html(text)}", self.styles["CustomBody"])
 
-    def _format_bold(self, text: str) -> str:
-        """Format bold text."""
-        import re
-        return re.sub(r"\*\*([^*]+)\*\*", r"<b>\1</b>", text)
+        if body_lines:
+            yield Paragraph("<br/>".join(body_lines), self.styles["CustomBody"])
+        # Render a code block left open at the end of the content
+        if code_lines:
+            yield _code_block(code_lines)
 
 
-def create_pdf_generator(output_dir: Path) -> PDFReportGenerator:
+def create_pdf_generator(output_dir: Path, backend: str = "reportlab") -> PDFReportGenerator:
     """Create a PDF report generator.
 
     Args:
         output_dir: Directory to save generated PDFs
+        backend: Rendering backend, "reportlab" or "weasyprint"
 
     Returns:
         PDF report generator instance
     """
-    return PDFReportGenerator(output_dir)
+    return PDFReportGenerator(output_dir, backend)
@@ -0,0 +1,40 @@
+"""Content-addressed naming for generated reports."""
+
+import hashlib
+import uuid
+from pathlib import Path
+from typing import Any
+
+import orjson
+
+
+def report_cache_key(*inputs: Any) -> str:
+    """Hash report inputs into a key for content-addressed PDF filenames.
+
+    Args:
+        *inputs: JSON-serializable values the report is rendered from
+
+    Returns:
+        Hex digest identifying the inputs
+    """
+    payload = orjson.dumps(inputs, option=orjson.OPT_SORT_KEYS, default=str)
+    return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+
+# Suffix of reports still being written; cleanup removes stale ones
+PARTIAL_SUFFIX = ".partial"
+
+
+def partial_report_path(path: Path) -> Path:
+    """Get a unique temporary path next to a report's final path.
+
+    Reports are rendered here and then moved into place with os.replace, so
+    a cache hit never sees a half-written file.
+
+    Args:
+        path: Final report path
+
+    Returns:
+        Temporary path in the same directory
+    """
+    return path.with_name(f".{path.stem}.{uuid.uuid4().hex}{PARTIAL_SUFFIX}")
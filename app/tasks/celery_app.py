@@ -1,20 +1,39 @@
+import orjson
 from celery import Celery
+from kombu.serialization import register
 
-from app.core.config import get_settings
+from app.config import get_worker_settings
 
-settings = get_settings()
+settings = get_worker_settings()
+
+# Task payloads carry whole analysis results; orjson encodes them in C
+register(
+    "orjson",
+    lambda obj: orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS),
+    orjson.loads,
+    content_type="application/x-orjson",
+    content_encoding="binary",
+)
 
 celery_app = Celery(
     "githubrepolens",
     broker=settings.celery_broker_url,
     backend=settings.celery_result_backend,
+    include=["app.tasks.celery_tasks", "app.tasks.pdf"],
 )
 
 celery_app.conf.update(
-    task_serializer="json",
-    accept_content=["json"],
-    result_serializer="json",
+    task_serializer="orjson",
+    # Plain JSON is still accepted from producers on the stock serializer
+    accept_content=["orjson", "json"],
+    result_serializer="orjson",
     timezone="UTC",
-    task_routes={"app.tasks.pdf.*": {"queue": "pdf"}},
+    enable_utc=True,
+    task_track_started=True,
+    task_time_limit=3600,  # 1 hour
+    task_soft_time_limit=3300,  # 55 minutes
+    task_routes={
+        "app.tasks.pdf.*": {"queue": "pdf"},
+        "generate_pdf_report": {"queue": "pdf"},
+    },
 )
-
@@ -1,33 +1,36 @@
 """Celery tasks for asynchronous processing."""
 
-from datetime import datetime
+import os
+from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
+from typing import TYPE_CHECKING, Iterable
 
-from celery import Celery, Task
+from celery import Task, group
+from celery.result import GroupResult
 from loguru import logger
 
-from app.config import get_settings
-from app.services.pdf_generator import create_pdf_generator
-
-# Initialize Celery
-settings = get_settings()
-celery_app = Celery(
-    "githubrepolens",
-    broker=settings.celery_broker_url,
-    backend=settings.celery_result_backend,
+from app.config import get_worker_settings
+from app.services.report_cache import (
+    PARTIAL_SUFFIX,
+    partial_report_path,
+    report_cache_key,
 )
+from app.tasks.celery_app import celery_app
+
+if TYPE_CHECKING:
+    from app.services.pdf_generator import PDFReportGenerator
+
+settings = get_worker_settings()
 
-# Celery configuration
-celery_app.conf.update(
-    task_serializer="json",
-    accept_content=["json"],
-    result_serializer="json",
-    timezone="UTC",
-    enable_utc=True,
-    task_track_started=True,
-    task_time_limit=3600,  # 1 hour
-    task_soft_time_limit=3300,  # 55 minutes
-)
+
+@lru_cache(maxsize=1)
+def _get_pdf_generator() -> "PDFReportGenerator":
+    """Get the PDF generator shared by every task in this worker process."""
+    # ReportLab is heavy to import; load it in the first worker that renders
+    from app.services.pdf_generator import create_pdf_generator
+
+    return create_pdf_generator(settings.report_output_dir, settings.pdf_backend)
 
 
 class CallbackTask(Task):
@@ -42,6 +45,21 @@ class CallbackTask(Task):
         logger.error(f"Task {task_id} failed: {exc}")
 
 
+def _report_result(
+    task_id: str, repo_url: str, project_name: str, pdf_path: Path, cached: bool
+) -> dict:
+    """Build the result payload of a PDF generation task."""
+    return {
+        "task_id": task_id,
+        "repo_url": repo_url,
+        "project_name": project_name,
+        "pdf_path": str(pdf_path),
+        "download_url": f"/api/v1/report/download/{pdf_path.name}",
+        "completed_at": datetime.now(timezone.utc).isoformat(),
+        "cached": cached,
+    }
+
+
 @celery_app.task(bind=True, base=CallbackTask, name="generate_pdf_report")
 def generate_pdf_report_task(
     self,
@@ -63,6 +81,20 @@ def generate_pdf_report_task(
     task_id = self.request.id
     logger.info(f"Starting PDF generation task {task_id} for {repo_url}")
 
+    # Identical inputs render to the same file; reuse it if present
+    cache_key = report_cache_key(analysis_result, repo_url, project_name, settings.pdf_backend)
+    output_filename = f"{project_name}_{cache_key}.pdf"
+    cached_path = Path(settings.report_output_dir) / output_filename
+    try:
+        # Refresh the mtime so cleanup keeps reports that are still requested
+        os.utime(cached_path)
+    except FileNotFoundError:
+        # Never rendered, or removed by cleanup since; render it again
+        pass
+    else:
+        logger.info(f"PDF generation task {task_id} reused cached report: {cached_path}")
+        return _report_result(task_id, repo_url, project_name, cached_path, cached=True)
+
     try:
         # Update task state to PROGRESS
         self.update_state(
@@ -70,37 +102,35 @@ def generate_pdf_report_task(
             meta={"progress": 10, "status": "Initializing PDF generator"},
         )
 
-        # Create PDF generator
-        pdf_generator = create_pdf_generator(settings.report_output_dir)
+        # Reuse this worker's PDF generator
+        pdf_generator = _get_pdf_generator()
 
         self.update_state(
             state="PROGRESS",
             meta={"progress": 30, "status": "Generating report content"},
         )
 
-        # Generate PDF
-        output_filename = f"{project_name}_{task_id}.pdf"
-        pdf_path = pdf_generator.generate(
-            analysis_result=analysis_result,
-            repo_url=repo_url,
-            project_name=project_name,
-            output_filename=output_filename,
-        )
+        # Generate PDF next to its final path, then publish it atomically so
+        # concurrent or interrupted renders never expose a truncated file
+        partial_path = partial_report_path(cached_path)
+        try:
+            pdf_generator.generate(
+                analysis_result=analysis_result,
+                repo_url=repo_url,
+                project_name=project_name,
+                output_filename=partial_path.name,
+            )
+            os.replace(partial_path, cached_path)
+        finally:
+            partial_path.unlink(missing_ok=True)
+        pdf_path = cached_path
 
         self.update_state(
             state="PROGRESS",
             meta={"progress": 90, "status": "Finalizing PDF"},
         )
 
-        # Prepare result
-        result = {
-            "task_id": task_id,
-            "repo_url": repo_url,
-            "project_name": project_name,
-            "pdf_path": str(pdf_path),
-            "download_url": f"/api/v1/report/download/{output_filename}",
-            "completed_at": datetime.utcnow().isoformat(),
-        }
+        result = _report_result(task_id, repo_url, project_name, pdf_path, cached=False)
 
         logger.info(f"PDF generation task {task_id} completed: {pdf_path}")
         return result
@@ -114,9 +144,32 @@ def generate_pdf_report_task(
         raise
 
 
+def submit_pdf_reports(reports: Iterable[dict]) -> GroupResult:
+    """Submit PDF generation for many reports in one batch.
+
+    The tasks are published together as a Celery group over a single
+    producer connection instead of one apply_async call per report.
+
+    Args:
+        reports: Report requests, each with analysis_result, repo_url and
+            project_name keys
+
+    Returns:
+        Group result tracking every submitted task
+    """
+    return group(
+        generate_pdf_report_task.s(
+            analysis_result=report["analysis_result"],
+            repo_url=report["repo_url"],
+            project_name=report["project_name"],
+        )
+        for report in reports
+    ).apply_async()
+
+
 @celery_app.task(name="cleanup_old_reports")
 def cleanup_old_reports_task(days: int = 7) -> dict:
-    """Clean up old PDF reports.
+    """Clean up old PDF reports and abandoned partial renders.
 
     Args:
         days: Delete reports older than this many days
@@ -127,18 +180,26 @@ def cleanup_old_reports_task(days: int = 7) -> dict:
     logger.info(f"Starting cleanup of reports older than {days} days")
 
     try:
-        report_dir = Path(settings.report_output_dir)
-        if not report_dir.exists():
-            return {"deleted": 0, "error": "Report directory does not exist"}
-
         cutoff_time = datetime.now().timestamp() - (days * 86400)
         deleted_count = 0
 
-        for pdf_file in report_dir.glob("*.pdf"):
-            if pdf_file.stat().st_mtime < cutoff_time:
-                pdf_file.unlink()
-                deleted_count += 1
-                logger.debug(f"Deleted old report: {pdf_file}")
+        # Single directory walk; DirEntry avoids building a Path per file.
+        # A missing directory surfaces from scandir itself, saving a stat.
+        try:
+            entries = os.scandir(settings.report_output_dir)
+        except FileNotFoundError:
+            return {"deleted": 0, "error": "Report directory does not exist"}
+
+        with entries:
+            for entry in entries:
+                if (
+                    entry.name.endswith((".pdf", PARTIAL_SUFFIX))
+                    and entry.is_file(follow_symlinks=False)
+                    and entry.stat(follow_symlinks=False).st_mtime < cutoff_time
+                ):
+                    os.unlink(entry.path)
+                    deleted_count += 1
+                    logger.debug("Deleted old report: {}", entry.path)
 
         logger.info(f"Cleanup completed: {deleted_count} reports deleted")
         return {"deleted": deleted_count, "days": days}
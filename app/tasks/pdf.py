@@ -1,53 +1,76 @@
+import os
 from pathlib import Path
-from typing import Dict
+from typing import TYPE_CHECKING, Dict
 
-from fpdf import FPDF
 from loguru import logger
 
-from app.core.config import get_settings
+from app.config import get_worker_settings
+from app.services.report_cache import partial_report_path, report_cache_key
 from app.tasks.celery_app import celery_app
 
+if TYPE_CHECKING:
+    from fpdf import FPDF
+
+# Report list sections: (heading, report key, label field, text field)
+_SECTIONS = (
+    ("Modules", "modules", "name", "description"),
+    ("Highlights", "highlights", "title", "description"),
+    ("Principles", "principles", "topic", "summary"),
+)
+
+
+def _write_section(pdf: "FPDF", heading: str, body: str, next_line: dict) -> None:
+    pdf.ln()
+    # Family is set once per document; only style and size change here
+    pdf.set_font(style="B", size=12)
+    pdf.cell(0, 10, heading, **next_line)
+    pdf.set_font(style="", size=11)
+    # One multi_cell per section instead of one per item
+    pdf.multi_cell(0, 8, text=body, **next_line)
+
 
 @celery_app.task(name="app.tasks.pdf.generate_pdf")
 def generate_pdf(report: Dict) -> str:
-    settings = get_settings()
+    settings = get_worker_settings()
     output_dir = Path(settings.report_output_dir)
     output_dir.mkdir(parents=True, exist_ok=True)
-    pdf_path = output_dir / "report.pdf"
+    pdf_path = output_dir / f"report_{report_cache_key(report)}.pdf"
+    try:
+        # Same report rendered before; refresh its mtime for cleanup
+        os.utime(pdf_path)
+    except FileNotFoundError:
+        # Never rendered, or removed by cleanup since
+        pass
+    else:
+        return str(pdf_path)
 
-    pdf = FPDF()
-    pdf.add_page()
-    pdf.set_font("Arial", size=12)
-    pdf.multi_cell(0, 10, txt=f"Repository: {report.get('repo_url', '')}")
+    # fpdf is slow to import, so defer it until a PDF is actually rendered
+    from fpdf import FPDF, XPos, YPos
 
-    pdf.ln()
-    pdf.set_font("Arial", "B", size=12)
-    pdf.cell(0, 10, "Modules", ln=True)
-    pdf.set_font("Arial", size=11)
-    for module in report.get("modules", []):
-        pdf.multi_cell(0, 8, txt=f"- {module.get('name')}: {module.get('description')}")
+    # Cell positioning that moves to the start of the next line
+    next_line = {"new_x": XPos.LMARGIN, "new_y": YPos.NEXT}
 
-    pdf.ln()
-    pdf.set_font("Arial", "B", size=12)
-    pdf.cell(0, 10, "Highlights", ln=True)
-    pdf.set_font("Arial", size=11)
-    for highlight in report.get("highlights", []):
-        pdf.multi_cell(0, 8, txt=f"- {highlight.get('title')}: {highlight.get('description')}")
+    pdf = FPDF()
+    pdf.add_page()
+    pdf.set_font("Helvetica", size=12)
+    pdf.multi_cell(0, 10, text=f"Repository: {report.get('repo_url', '')}", **next_line)
 
-    pdf.ln()
-    pdf.set_font("Arial", "B", size=12)
-    pdf.cell(0, 10, "Principles", ln=True)
-    pdf.set_font("Arial", size=11)
-    for principle in report.get("principles", []):
-        pdf.multi_cell(0, 8, txt=f"- {principle.get('topic')}: {principle.get('summary')}")
+    for heading, key, label_field, text_field in _SECTIONS:
+        body = "\n".join(
+            f"- {item.get(label_field)}: {item.get(text_field)}"
+            for item in report.get(key, [])
+        )
+        _write_section(pdf, heading, body, next_line)
 
-    pdf.ln()
-    pdf.set_font("Arial", "B", size=12)
-    pdf.cell(0, 10, "Summary", ln=True)
-    pdf.set_font("Arial", size=11)
-    pdf.multi_cell(0, 8, txt=report.get("summary", ""))
+    _write_section(pdf, "Summary", report.get("summary", ""), next_line)
 
-    pdf.output(str(pdf_path))
+    # Publish atomically so concurrent or interrupted renders never expose
+    # a truncated file at the cached path
+    partial_path = partial_report_path(pdf_path)
+    try:
+        pdf.output(str(partial_path))
+        os.replace(partial_path, pdf_path)
+    finally:
+        partial_path.unlink(missing_ok=True)
     logger.info("Generated PDF at {}", pdf_path)
     return str(pdf_path)
-
@@ -1,11 +1,58 @@
 """Pytest configuration and fixtures."""
 
 import os
+from functools import lru_cache
 from pathlib import Path
+from typing import Callable, Iterator
 
 import pytest
 
 from app.config import Settings
+from app.prompts.base import PromptLoader, PromptTemplate
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    """Add custom pytest options."""
+    parser.addoption(
+        "--run-integration",
+        action="store_true",
+        default=False,
+        help="Run integration tests",
+    )
+
+
+def pytest_collection_modifyitems(config: pytest.Config, items: list[pytest.Item]) -> None:
+    """Skip integration tests unless --run-integration is given."""
+    if config.getoption("--run-integration"):
+        return
+    skip_integration = pytest.mark.skip(reason="needs --run-integration")
+    for item in items:
+        if "integration" in item.keywords:
+            item.add_marker(skip_integration)
+
+
+# API key field for each LLM provider
+_PROVIDER_KEY_FIELDS = {
+    "openai": "openai_api_key",
+    "gemini": "gemini_api_key",
+    "openrouter": "openrouter_api_key",
+}
+
+
+@lru_cache(maxsize=None)
+def _provider_settings(provider: str, model: str, with_key: bool) -> Settings:
+    """Build settings for a provider once per distinct configuration."""
+    return Settings(
+        llm_provider=provider,
+        llm_model=model,
+        **{_PROVIDER_KEY_FIELDS[provider]: "test-key" if with_key else None},
+    )
+
+
+@pytest.fixture(scope="session")
+def provider_settings() -> Callable[[str, str, bool], Settings]:
+    """Factory for shared, read-only provider settings."""
+    return _provider_settings
 
 
 @pytest.fixture
@@ -25,6 +72,25 @@ def test_settings() -> Settings:
     )
 
 
+@pytest.fixture(scope="session")
+def prompt_loader() -> PromptLoader:
+    """Prompt loader shared across the session, so templates compile once."""
+    return PromptLoader()
+
+
+@pytest.fixture(scope="module")
+def system_template(prompt_loader: PromptLoader) -> PromptTemplate:
+    """System prompt template, loaded once per test module."""
+    return prompt_loader.load("system")
+
+
+@pytest.fixture
+def clean_prompt_loader(prompt_loader: PromptLoader) -> Iterator[PromptLoader]:
+    """Shared prompt loader whose cache is reset after the test."""
+    yield prompt_loader
+    prompt_loader.clear_cache()
+
+
 @pytest.fixture
 def mock_repo_url() -> str:
     """Mock GitHub repository URL."""
@@ -0,0 +1,187 @@
+"""Tests for the analysis agent."""
+
+import asyncio
+import json
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import AIMessage, AIMessageChunk
+from langchain_core.outputs import ChatGeneration, ChatGenerationChunk, ChatResult
+from langchain_core.tools import StructuredTool
+
+from app.core.agent import (
+    _MAX_TOOL_RESULT_CHARS,
+    RepositoryAnalysisAgent,
+    _build_prompt,
+    _format_tool_result,
+    _render_prompts,
+)
+
+
+def test_build_prompt_substitutes_repo_url(mock_repo_url: str):
+    """Test building the full prompt substitutes the repository URL."""
+    prompt = _build_prompt(mock_repo_url, "en")
+
+    assert mock_repo_url in prompt
+    assert "{repo_url}" not in prompt
+    assert "GitHub repository" in prompt
+
+
+def test_render_prompts_cached_per_language():
+    """Test rendered prompts are cached per language."""
+    _render_prompts.cache_clear()
+
+    _build_prompt("https://github.com/test-user/repo-a", "en")
+    _build_prompt("https://github.com/test-user/repo-b", "en")
+    _build_prompt("https://github.com/test-user/repo-a", "zh")
+
+    info = _render_prompts.cache_info()
+    assert info.misses == 2
+    assert info.hits == 1
+
+
+def test_format_tool_result():
+    """Test tool results are formatted as strings."""
+    assert _format_tool_result("plain") == "plain"
+    assert json.loads(_format_tool_result({"path": "src", "size": 1})) == {
+        "path": "src",
+        "size": 1,
+    }
+    assert json.loads(_format_tool_result([1, 2])) == [1, 2]
+    assert _format_tool_result([{"text": "a"}, {"type": "image"}, {"text": "b"}]) == "a\nb"
+    assert _format_tool_result(42) == "42"
+
+
+def test_format_tool_result_compact_and_truncated():
+    """Test structured results are compact and long results truncated."""
+    assert _format_tool_result({"a": [1, 2]}) == '{"a":[1,2]}'
+
+    content = _format_tool_result("x" * (_MAX_TOOL_RESULT_CHARS + 10))
+
+    assert content.startswith("x" * _MAX_TOOL_RESULT_CHARS)
+    assert content.endswith("[truncated]")
+    assert len(content) < _MAX_TOOL_RESULT_CHARS + 100
+
+
+@pytest.mark.asyncio
+async def test_tool_node_runs_tool_calls_concurrently():
+    """Test tool calls from one message run concurrently and keep order."""
+    started = 0
+    both_started = asyncio.Event()
+
+    async def slow_echo(text: str) -> str:
+        """Echo text once every tool call has started."""
+        nonlocal started
+        started += 1
+        if started == 2:
+            both_started.set()
+        await asyncio.wait_for(both_started.wait(), timeout=1)
+        return text
+
+    tool = StructuredTool.from_function(coroutine=slow_echo, name="echo")
+    agent = RepositoryAnalysisAgent(llm=MagicMock(), tools=[tool])
+    message = AIMessage(
+        content="",
+        tool_calls=[
+            {"name": "echo", "args": {"text": "first"}, "id": "call-1"},
+            {"name": "echo", "args": {"text": "second"}, "id": "call-2"},
+            {"name": "missing", "args": {}, "id": "call-3"},
+        ],
+    )
+
+    result = await agent._custom_tool_node_async({"messages": [message]})
+
+    contents = [tool_message.content for tool_message in result["messages"]]
+    assert contents == ["first", "second", "Tool missing not found"]
+    assert result["messages"][2].status == "error"
+
+
+@pytest.mark.asyncio
+async def test_agent_node_binds_tools_once():
+    """Test tools are bound to the LLM once and reused across steps."""
+    llm = MagicMock()
+    llm.bind_tools.return_value.ainvoke = AsyncMock(
+        return_value=AIMessage(content="done")
+    )
+    agent = RepositoryAnalysisAgent(llm=llm, tools=[])
+    state = {"messages": [AIMessage(content="start")]}
+
+    await agent._agent_node_async(state)
+    await agent._agent_node_async(state)
+
+    llm.bind_tools.assert_called_once_with([])
+    assert llm.bind_tools.return_value.ainvoke.await_count == 2
+
+
+class _FakeToolCallingModel(BaseChatModel):
+    """Fake chat model that replays scripted responses."""
+
+    responses: list[AIMessage]
+
+    @property
+    def _llm_type(self) -> str:
+        return "fake-tool-calling"
+
+    def bind_tools(self, tools, **kwargs):
+        return self
+
+    def _generate(self, messages, stop=None, run_manager=None, **kwargs):
+        return ChatResult(generations=[ChatGeneration(message=self.responses.pop(0))])
+
+    def _stream(self, messages, stop=None, run_manager=None, **kwargs):
+        message = self.responses.pop(0)
+        yield ChatGenerationChunk(
+            message=AIMessageChunk(
+                content=message.content,
+                tool_call_chunks=[
+                    {
+                        "name": tool_call["name"],
+                        "args": json.dumps(tool_call["args"]),
+                        "id": tool_call["id"],
+                        "index": index,
+                    }
+                    for index, tool_call in enumerate(message.tool_calls)
+                ],
+            )
+        )
+
+
+@pytest.mark.asyncio
+async def test_stream_analysis_events(mock_repo_url: str):
+    """Test streaming yields tool and token events from the graph."""
+
+    async def echo(text: str) -> str:
+        """Echo text."""
+        return text
+
+    tool = StructuredTool.from_function(coroutine=echo, name="echo")
+    llm = _FakeToolCallingModel(
+        responses=[
+            AIMessage(
+                content="",
+                tool_calls=[{"name": "echo", "args": {"text": "hi"}, "id": "call-1"}],
+            ),
+            AIMessage(content="report"),
+        ]
+    )
+    agent = RepositoryAnalysisAgent(llm=llm, tools=[tool])
+
+    events = [event async for event in agent.stream_analysis(mock_repo_url)]
+
+    event_types = [event["type"] for event in events]
+    assert event_types == ["tool_calls", "tool_result", "token"]
+    assert events[0]["tool_calls"][0]["name"] == "echo"
+    assert events[1]["name"] == "echo"
+    assert events[2]["content"] == "report"
+
+
+@pytest.mark.asyncio
+async def test_tool_node_without_tool_calls():
+    """Test tool node returns no messages when there is nothing to run."""
+    agent = RepositoryAnalysisAgent(llm=MagicMock(), tools=[])
+
+    assert await agent._custom_tool_node_async({"messages": []}) == {"messages": []}
+    assert await agent._custom_tool_node_async(
+        {"messages": [AIMessage(content="done")]}
+    ) == {"messages": []}
@@ -1,9 +1,19 @@
 """Tests for repository analyzer."""
 
+import json
+import time
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import orjson
 import pytest
 
 from app.config import Settings
-from app.services.analyzer import RepositoryAnalyzer
+from app.services.analyzer import (
+    AnalysisEvent,
+    RepositoryAnalyzer,
+    _tool_call_message,
+)
 
 
 @pytest.mark.asyncio
@@ -39,13 +49,131 @@ async def test_analyzer_stream_before_init(
 
 
 @pytest.mark.asyncio
-@pytest.mark.skipif(
-    not pytest.config.getoption("--run-integration", default=False),
-    reason="Integration test - requires API keys and MCP server",
-)
+@pytest.mark.integration
 async def test_analyzer_integration(test_settings: Settings, mock_repo_url: str):
     """Integration test for analyzer (requires API keys and MCP)."""
     async with RepositoryAnalyzer(test_settings) as analyzer:
         # Test that analyzer is initialized
         assert analyzer._agent is not None
         assert analyzer._mcp_client is not None
+
+
+def test_analysis_event_sse_format():
+    """Test analysis event serializes to an SSE message."""
+    timestamp = datetime(2024, 1, 1, 12, 30, 0, 250000, tzinfo=timezone.utc)
+    event = AnalysisEvent(
+        event_type="token",
+        data={"content": "héllo"},
+        timestamp=int(timestamp.timestamp()) * 1_000_000_000 + 250_000_000,
+    )
+
+    message = event.to_sse_format()
+
+    assert message.startswith(b"data: ")
+    assert message.endswith(b"\n\n")
+    assert json.loads(message[len(b"data: "):]) == {
+        "type": "token",
+        "data": {"content": "héllo"},
+        "timestamp": "2024-01-01T12:30:00.250000Z",
+    }
+
+
+@pytest.mark.parametrize(
+    "event_type,data",
+    [
+        ("token", {"content": 'say "hi"\n'}),
+        ("token", {"content": [{"type": "text", "text": "hi"}]}),
+        ("token", {"content": "hi", "extra": 1}),
+        ("tool_call", {"message": "IsGettingRepoStructure", "tool": "x"}),
+    ],
+)
+def test_analysis_event_sse_format_matches_generic(event_type: str, data: dict):
+    """Test the token fast path produces the same bytes as generic framing."""
+    event = AnalysisEvent(event_type=event_type, data=data, timestamp=1_700_000_000_123_456_789)
+    expected = {
+        "type": event_type,
+        "data": data,
+        "timestamp": "2023-11-14T22:13:20.123456Z",
+    }
+
+    message = event.to_sse_format()
+
+    assert message == b"data: " + orjson.dumps(expected) + b"\n\n"
+
+
+@pytest.mark.asyncio
+async def test_analyzer_uses_pooled_mcp_client(test_settings: Settings):
+    """Test each analyzer acquires the pooled MCP client and releases it on close."""
+    mcp_client = MagicMock(get_tools=AsyncMock(return_value=[]), close=AsyncMock())
+
+    with patch(
+        "app.services.analyzer.create_mcp_client", AsyncMock(return_value=mcp_client)
+    ) as create_client, patch("app.services.analyzer.create_llm_from_settings"), patch(
+        "app.services.analyzer.create_analysis_agent"
+    ) as create_agent:
+        async with RepositoryAnalyzer(test_settings) as analyzer1:
+            assert analyzer1._agent is create_agent.return_value
+        async with RepositoryAnalyzer(test_settings) as analyzer2:
+            assert analyzer2._mcp_client is mcp_client
+
+    assert create_client.await_count == 2
+    assert mcp_client.close.await_count == 2
+    assert analyzer2._agent is None
+
+
+@pytest.mark.parametrize(
+    "tool_name,args,expected",
+    [
+        ("read_file", {"path": "app/main.py"}, "IsAnalyzingFile app/main.py"),
+        ("list_directory", {"path": "app"}, "IsListingDirectory app"),
+        ("read_file", {}, "IsExecuting read_file"),
+        ("get_repo_structure", {}, "IsGettingRepoStructure"),
+        ("search_code", {"query": "x"}, "IsExecuting search_code"),
+    ],
+)
+def test_tool_call_message(tool_name: str, args: dict, expected: str):
+    """Test progress messages for tool calls."""
+    assert _tool_call_message(tool_name, args) == expected
+
+
+def test_analysis_event_default_timestamp():
+    """Test analysis events are stamped with the current time."""
+    before = time.time_ns()
+    event = AnalysisEvent(event_type="start", data={})
+
+    assert before <= event.timestamp <= time.time_ns()
+
+
+@pytest.mark.asyncio
+async def test_analyzer_stream_events(test_settings: Settings, mock_repo_url: str):
+    """Test agent events are converted to analysis events."""
+
+    async def agent_events(repo_url: str, language: str = "en"):
+        yield {
+            "type": "tool_calls",
+            "tool_calls": [
+                {"name": "read_file", "args": {"path": "README.md"}, "id": "call-1"},
+                {"name": "get_repo_structure", "args": None, "id": "call-2"},
+            ],
+        }
+        yield {"type": "tool_result", "name": "read_file", "content": "..."}
+        yield {"type": "token", "content": "report"}
+        yield {"type": "token", "content": ""}
+
+    analyzer = RepositoryAnalyzer(test_settings)
+    analyzer._agent = MagicMock(stream_analysis=agent_events)
+
+    events = [event async for event in analyzer.stream_analysis(mock_repo_url)]
+
+    assert [event.event_type for event in events] == [
+        "start",
+        "tool_call",
+        "tool_call",
+        "tool_result",
+        "token",
+        "complete",
+    ]
+    assert events[1].data == {"message": "IsAnalyzingFile README.md", "tool": "read_file"}
+    assert events[2].data["message"] == "IsGettingRepoStructure"
+    assert events[3].data["message"] == "Completed read_file"
+    assert events[4].data == {"content": "report"}
@@ -1,11 +1,13 @@
+import os
+import time
 import pytest
 from pathlib import Path
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 from app.tasks.pdf import generate_pdf
 
 
-@patch("app.tasks.pdf.get_settings")
+@patch("app.tasks.pdf.get_worker_settings")
 def test_generate_pdf_task(mock_get_settings, tmp_path):
     mock_settings = type('Settings', (), {
         'report_output_dir': tmp_path
@@ -36,7 +38,163 @@ def test_generate_pdf_task(mock_get_settings, tmp_path):
 def test_celery_app_config():
     from app.tasks.celery_app import celery_app
     
-    assert celery_app.conf.task_serializer == "json"
-    assert celery_app.conf.accept_content == ["json"]
-    assert celery_app.conf.result_serializer == "json"
+    assert celery_app.conf.task_serializer == "orjson"
+    assert celery_app.conf.accept_content == ["orjson", "json"]
+    assert celery_app.conf.result_serializer == "orjson"
 
+
+def test_orjson_serializer_round_trip(mock_analysis_result):
+    from kombu.serialization import dumps, loads, prepare_accept_content
+
+    from app.tasks.celery_app import celery_app
+
+    payload = ((), {"analysis_result": mock_analysis_result, "counts": {1: "one"}}, {})
+    content_type, encoding, body = dumps(payload, serializer="orjson")
+
+    accept = prepare_accept_content(celery_app.conf.accept_content)
+
+    decoded = loads(body, content_type, encoding, accept=accept)
+    expected_kwargs = {"analysis_result": mock_analysis_result, "counts": {"1": "one"}}
+    assert decoded == [[], expected_kwargs, {}]
+
+
+def test_cleanup_old_reports(tmp_path):
+    from app.tasks import celery_tasks
+
+    old_time = time.time() - 10 * 86400
+    for name in ("old.pdf", "old.txt", "new.pdf"):
+        (tmp_path / name).write_bytes(b"%PDF")
+    os.utime(tmp_path / "old.pdf", (old_time, old_time))
+    os.utime(tmp_path / "old.txt", (old_time, old_time))
+
+    with patch.object(celery_tasks.settings, "report_output_dir", tmp_path):
+        result = celery_tasks.cleanup_old_reports_task(days=7)
+
+    assert result == {"deleted": 1, "days": 7}
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["new.pdf", "old.txt"]
+
+
+def test_cleanup_missing_report_dir(tmp_path):
+    from app.tasks import celery_tasks
+
+    with patch.object(celery_tasks.settings, "report_output_dir", tmp_path / "missing"):
+        result = celery_tasks.cleanup_old_reports_task(days=7)
+
+    assert result == {"deleted": 0, "error": "Report directory does not exist"}
+
+
+@patch("app.tasks.pdf.get_worker_settings")
+def test_generate_pdf_reuses_cached_report(mock_get_settings, tmp_path):
+    mock_get_settings.return_value = type(
+        "Settings", (), {"report_output_dir": tmp_path}
+    )()
+    report = {"repo_url": "https://github.com/test/repo", "summary": "Test summary"}
+
+    first = generate_pdf(report)
+    with patch("fpdf.FPDF") as fpdf:
+        fpdf.return_value.output.side_effect = lambda path: Path(path).write_bytes(b"%PDF")
+        second = generate_pdf(dict(reversed(report.items())))
+        other = generate_pdf({**report, "summary": "Changed"})
+
+    assert first == second
+    assert other != first
+    fpdf.assert_called_once()
+
+
+def test_generate_pdf_report_task_cache_hit(tmp_path, mock_analysis_result):
+    from app.services.report_cache import report_cache_key
+    from app.tasks import celery_tasks
+
+    repo_url = "https://github.com/test-user/test-repo"
+    key = report_cache_key(mock_analysis_result, repo_url, "test-repo", "reportlab")
+    cached = tmp_path / f"test-repo_{key}.pdf"
+    cached.write_bytes(b"%PDF")
+
+    with patch.object(celery_tasks.settings, "report_output_dir", tmp_path), patch.object(
+        celery_tasks, "_get_pdf_generator"
+    ) as get_generator:
+        result = celery_tasks.generate_pdf_report_task.apply(
+            kwargs={
+                "analysis_result": mock_analysis_result,
+                "repo_url": repo_url,
+                "project_name": "test-repo",
+            }
+        ).get()
+
+    get_generator.assert_not_called()
+    assert result["cached"] is True
+    assert result["pdf_path"] == str(cached)
+    assert result["download_url"] == f"/api/v1/report/download/{cached.name}"
+
+
+def test_cleanup_removes_abandoned_partial_renders(tmp_path):
+    from app.tasks import celery_tasks
+
+    old_time = time.time() - 10 * 86400
+    for name in (".old.abc.partial", ".new.def.partial"):
+        (tmp_path / name).write_bytes(b"%PDF")
+    os.utime(tmp_path / ".old.abc.partial", (old_time, old_time))
+
+    with patch.object(celery_tasks.settings, "report_output_dir", tmp_path):
+        result = celery_tasks.cleanup_old_reports_task(days=7)
+
+    assert result == {"deleted": 1, "days": 7}
+    assert [path.name for path in tmp_path.iterdir()] == [".new.def.partial"]
+
+
+def _run_pdf_report_task(celery_tasks, tmp_path, generator, analysis_result):
+    with patch.object(celery_tasks.settings, "report_output_dir", tmp_path), patch.object(
+        celery_tasks, "_get_pdf_generator", return_value=generator
+    ), patch.object(celery_tasks.generate_pdf_report_task, "update_state"):
+        return celery_tasks.generate_pdf_report_task.apply(
+            kwargs={
+                "analysis_result": analysis_result,
+                "repo_url": "https://github.com/test-user/test-repo",
+                "project_name": "test-repo",
+            }
+        )
+
+
+def test_generate_pdf_report_task_publishes_atomically(tmp_path, mock_analysis_result):
+    from app.services.pdf_generator import create_pdf_generator
+    from app.tasks import celery_tasks
+
+    generator = create_pdf_generator(tmp_path)
+    result = _run_pdf_report_task(
+        celery_tasks, tmp_path, generator, mock_analysis_result
+    ).get()
+
+    pdf_path = Path(result["pdf_path"])
+    assert result["cached"] is False
+    assert [path.name for path in tmp_path.iterdir()] == [pdf_path.name]
+    assert pdf_path.read_bytes().startswith(b"%PDF")
+
+
+def test_generate_pdf_report_task_failure_leaves_no_file(tmp_path, mock_analysis_result):
+    from app.tasks import celery_tasks
+
+    def render_then_fail(output_filename, **kwargs):
+        (tmp_path / output_filename).write_bytes(b"%PDF-truncated")
+        raise RuntimeError("worker interrupted")
+
+    generator = MagicMock()
+    generator.generate.side_effect = render_then_fail
+    result = _run_pdf_report_task(celery_tasks, tmp_path, generator, mock_analysis_result)
+
+    assert result.failed()
+    assert not list(tmp_path.iterdir())
+
+
+def test_generate_pdf_report_task_renders_when_cleanup_wins(tmp_path, mock_analysis_result):
+    from app.services.pdf_generator import create_pdf_generator
+    from app.tasks import celery_tasks
+
+    generator = create_pdf_generator(tmp_path)
+    # Cleanup removes the cached report just before its mtime is refreshed
+    with patch.object(celery_tasks.os, "utime", side_effect=FileNotFoundError):
+        result = _run_pdf_report_task(
+            celery_tasks, tmp_path, generator, mock_analysis_result
+        ).get()
+
+    assert result["cached"] is False
+    assert Path(result["pdf_path"]).read_bytes().startswith(b"%PDF")
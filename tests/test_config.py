@@ -1,8 +1,9 @@
 import os
+from pathlib import Path
 
 import pytest
 
-from app.core.config import Settings, get_settings
+from app.config import Settings, get_settings, get_worker_settings
 
 
 def test_settings_from_env():
@@ -43,3 +44,23 @@ def test_settings_provider_validation():
     settings = Settings(llm_provider="openrouter")
     assert settings.llm_provider == "openrouter"
 
+
+def test_get_worker_settings_skips_provider_validation(monkeypatch):
+    monkeypatch.delenv("OPENAI_API_KEY", raising=False)
+    monkeypatch.setenv("LLM_PROVIDER", "openai")
+    get_worker_settings.cache_clear()
+
+    try:
+        settings = get_worker_settings()
+        assert settings.openai_api_key is None
+        assert get_worker_settings() is settings
+    finally:
+        get_worker_settings.cache_clear()
+
+
+def test_mcp_tool_cache_dir_expands_user(monkeypatch):
+    monkeypatch.setenv("MCP_TOOL_CACHE_DIR", "~/.cache/github-repo-lens")
+
+    settings = Settings()
+
+    assert settings.mcp_tool_cache_dir == Path.home() / ".cache" / "github-repo-lens"
@@ -5,7 +5,11 @@ from langchain_google_genai import ChatGoogleGenerativeAI
 from langchain_openai import ChatOpenAI
 
 from app.config import Settings
-from app.core.llm_factory import LLMFactory, create_llm_from_settings
+from app.core.llm_factory import (
+    LLMFactory,
+    close_http_clients,
+    create_llm_from_settings,
+)
 
 
 def test_create_openai_llm(test_settings: Settings):
@@ -65,3 +69,42 @@ def test_create_llm_from_settings(test_settings: Settings):
 
     assert isinstance(llm, ChatOpenAI)
     assert llm.model_name == "gpt-4o-mini"
+
+
+def test_create_llm_reuses_instance(test_settings: Settings):
+    """Test identical configurations share one LLM instance."""
+    test_settings.openai_api_key = "test-key"
+
+    llm1 = LLMFactory.create("openai", "gpt-4o-mini", test_settings)
+    llm2 = LLMFactory.create("openai", "gpt-4o-mini", test_settings)
+    llm3 = LLMFactory.create("openai", "gpt-4o", test_settings)
+
+    assert llm1 is llm2
+    assert llm1 is not llm3
+
+
+def test_openai_compatible_llms_share_http_clients(test_settings: Settings):
+    """Test OpenAI-compatible models share process-wide HTTP clients."""
+    test_settings.openai_api_key = "test-key"
+    test_settings.openrouter_api_key = "test-key"
+
+    openai_llm = LLMFactory.create("openai", "gpt-4o-mini", test_settings)
+    openrouter_llm = LLMFactory.create("openrouter", "openai/gpt-4", test_settings)
+
+    assert openai_llm.http_async_client is openrouter_llm.http_async_client
+    assert openai_llm.http_client is openrouter_llm.http_client
+
+
+@pytest.mark.asyncio
+async def test_close_http_clients(test_settings: Settings):
+    """Test shutdown closes the shared HTTP clients and later models get new ones."""
+    test_settings.openai_api_key = "test-key"
+
+    llm = LLMFactory.create("openai", "gpt-4o-mini", test_settings)
+    await close_http_clients()
+    fresh = LLMFactory.create("openai", "gpt-4o-mini", test_settings)
+
+    assert llm.http_async_client.is_closed
+    assert llm.http_client.is_closed
+    assert fresh is not llm
+    assert not fresh.http_async_client.is_closed
@@ -1,9 +1,14 @@
 """Tests for MCP client."""
 
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
+
 import pytest
+from langchain_mcp_adapters.tools import convert_mcp_tool_to_langchain_tool
+from mcp.types import Tool as MCPTool
 
 from app.config import Settings
-from app.core.mcp_client import MCPClientManager
+from app.core.mcp_client import MCPClientManager, close_mcp_clients, create_mcp_client
 
 
 @pytest.mark.asyncio
@@ -24,11 +29,96 @@ async def test_mcp_client_get_tools_before_init(test_settings: Settings):
         await manager.get_tools()
 
 
+async def _fake_initialize(self: MCPClientManager) -> None:
+    """Stand-in for initialize() that does not spawn the MCP server."""
+    self._client = MagicMock()
+    self._tools = []
+
+
+@pytest.mark.asyncio
+async def test_create_mcp_client_reuses_manager(test_settings: Settings):
+    """Test pooled managers are shared and survive release."""
+    with patch.object(
+        MCPClientManager, "initialize", autospec=True, side_effect=_fake_initialize
+    ) as initialize:
+        manager1 = await create_mcp_client(test_settings)
+        await manager1.close()
+        # Extra releases, e.g. async with around a pooled manager, are harmless
+        await manager1.close()
+        manager2 = await create_mcp_client(test_settings)
+
+        assert manager1 is manager2
+        assert manager2._client is not None
+        assert await manager2.get_tools() == []
+        initialize.assert_called_once()
+
+        await close_mcp_clients()
+
+    assert manager2._client is None
+
+
+def _mcp_tools(settings: Settings) -> list:
+    """Build LangChain tools the way the MCP adapter does."""
+    tool = MCPTool(
+        name="read_file",
+        description="Read a file from a repository",
+        inputSchema={
+            "type": "object",
+            "properties": {"path": {"type": "string"}},
+            "required": ["path"],
+        },
+        annotations={"readOnlyHint": True},
+    )
+    connection = {"transport": "stdio", "command": "npx", "args": []}
+    return [
+        convert_mcp_tool_to_langchain_tool(
+            None, tool, connection=connection, server_name=settings.mcp_server
+        )
+    ]
+
+
+@pytest.mark.asyncio
+async def test_mcp_client_caches_tool_descriptors(test_settings: Settings, tmp_path: Path):
+    """Test tool descriptors are cached to disk and reused on the next start."""
+    settings = test_settings.model_copy(update={"mcp_tool_cache_dir": tmp_path})
+    tools = _mcp_tools(settings)
+
+    with patch("app.core.mcp_client.MultiServerMCPClient") as client_class:
+        client_class.return_value.get_tools = AsyncMock(return_value=tools)
+        client_class.return_value.connections = {
+            settings.mcp_server: {"transport": "stdio", "command": "npx", "args": []}
+        }
+        await MCPClientManager(settings).initialize()
+        manager = MCPClientManager(settings)
+        await manager.initialize()
+
+    client_class.return_value.get_tools.assert_awaited_once()
+    assert len(list(tmp_path.glob("tools-*.json"))) == 1
+    [cached] = await manager.get_tools()
+    assert cached.name == "read_file"
+    assert cached.description == tools[0].description
+    assert cached.args_schema == tools[0].args_schema
+    assert cached.metadata == tools[0].metadata
+
+
 @pytest.mark.asyncio
-@pytest.mark.skipif(
-    not pytest.config.getoption("--run-integration"),
-    reason="Integration test - requires github-repo-mcp to be available",
-)
+async def test_mcp_client_tool_cache_disabled(test_settings: Settings, tmp_path: Path):
+    """Test a zero TTL disables the tool descriptor cache."""
+    settings = test_settings.model_copy(
+        update={"mcp_tool_cache_dir": tmp_path, "mcp_tool_cache_ttl": 0}
+    )
+
+    with patch("app.core.mcp_client.MultiServerMCPClient") as client_class:
+        client_class.return_value.get_tools = AsyncMock(return_value=_mcp_tools(settings))
+        await MCPClientManager(settings).initialize()
+        await MCPClientManager(settings).initialize()
+
+    assert client_class.return_value.get_tools.await_count == 2
+    assert not list(tmp_path.iterdir())
+
+
+@pytest.mark.asyncio
+@pytest.mark.integration
 async def test_mcp_client_integration(test_settings: Settings):
     """Integration test for MCP client (requires github-repo-mcp)."""
     async with MCPClientManager(test_settings) as manager:
@@ -37,13 +127,3 @@ async def test_mcp_client_integration(test_settings: Settings):
         assert len(tools) > 0
         assert all(hasattr(tool, "name") for tool in tools)
         assert all(hasattr(tool, "description") for tool in tools)
-
-
-def pytest_addoption(parser):
-    """Add custom pytest options."""
-    parser.addoption(
-        "--run-integration",
-        action="store_true",
-        default=False,
-        help="Run integration tests",
-    )
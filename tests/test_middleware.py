@@ -0,0 +1,60 @@
+"""Tests for HTTP middleware."""
+
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import StreamingResponse
+from fastapi.testclient import TestClient
+
+from app.api.middleware import CORSMiddleware
+
+
+@pytest.fixture
+def client() -> TestClient:
+    """Create a test client for a small app wrapped in CORS middleware."""
+    app = FastAPI()
+    app.add_middleware(CORSMiddleware)
+
+    @app.get("/stream")
+    async def stream() -> StreamingResponse:
+        async def chunks():
+            yield b"a"
+            yield b"b"
+
+        return StreamingResponse(chunks(), media_type="text/event-stream")
+
+    return TestClient(app)
+
+
+def test_cors_header_on_response(client: TestClient):
+    """Test responses allow any origin and keep their body."""
+    response = client.get("/stream", headers={"Origin": "https://example.com"})
+
+    assert response.status_code == 200
+    assert response.headers["access-control-allow-origin"] == "*"
+    assert response.headers["content-type"].startswith("text/event-stream")
+    assert response.content == b"ab"
+
+
+def test_cors_preflight(client: TestClient):
+    """Test preflight requests are answered without reaching the app."""
+    response = client.options(
+        "/stream",
+        headers={
+            "Origin": "https://example.com",
+            "Access-Control-Request-Method": "POST",
+            "Access-Control-Request-Headers": "content-type, x-custom",
+        },
+    )
+
+    assert response.status_code == 204
+    assert response.headers["access-control-allow-origin"] == "*"
+    assert "POST" in response.headers["access-control-allow-methods"]
+    assert response.headers["access-control-allow-headers"] == "content-type, x-custom"
+
+
+def test_options_without_preflight_reaches_app(client: TestClient):
+    """Test plain OPTIONS requests are passed through to the app."""
+    response = client.options("/stream")
+
+    assert response.status_code == 405
+    assert response.headers["access-control-allow-origin"] == "*"
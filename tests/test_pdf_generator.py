@@ -0,0 +1,198 @@
+"""Tests for PDF report generation."""
+
+from datetime import datetime
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from langchain_core.messages import AIMessage, HumanMessage
+from reportlab.lib.pagesizes import A4
+from reportlab.lib.units import cm
+from reportlab.pdfbase.pdfmetrics import stringWidth
+from reportlab.platypus import Paragraph
+
+from app.services.pdf_generator import PDFReportGenerator, create_pdf_generator
+
+
+def test_generate_pdf(tmp_path: Path, mock_repo_url: str):
+    """Test a PDF report is written to the output directory."""
+    generator = create_pdf_generator(tmp_path)
+    analysis_result = {
+        "messages": [
+            HumanMessage(content="Analyze repository"),
+            AIMessage(content="# Analysis\n\n## Overview\n\nUses **FastAPI** and `uvicorn`."),
+        ]
+    }
+
+    output_path = generator.generate(
+        analysis_result=analysis_result,
+        repo_url=mock_repo_url,
+        project_name="test-repo",
+        output_filename="report.pdf",
+    )
+
+    assert output_path == tmp_path / "report.pdf"
+    assert output_path.read_bytes().startswith(b"%PDF")
+
+
+def test_generators_share_styles(tmp_path: Path):
+    """Test report styles are built once and shared by generators."""
+    generator1 = PDFReportGenerator(tmp_path)
+    generator2 = PDFReportGenerator(tmp_path)
+
+    assert generator1.styles is generator2.styles
+    assert generator1.styles["CustomBody"].fontSize == 11
+    assert generator1.styles["h1"] is generator1.styles["Heading1"]
+
+
+def test_parse_markdown_inline_formatting(tmp_path: Path):
+    """Test body lines are escaped and inline markdown is converted."""
+    generator = PDFReportGenerator(tmp_path)
+
+    [paragraph] = generator._parse_markdown_content("Use `a<b>` with **care** & joy")
+
+    assert isinstance(paragraph, Paragraph)
+    assert paragraph.text == (
+        'Use <font face="Courier" size="9" color="#c0392b">a&lt;b&gt;</font>'
+        " with <b>care</b> &amp; joy"
+    )
+
+
+def test_parse_markdown_headers_and_bullets(tmp_path: Path):
+    """Test headers and bullets map to their paragraph styles."""
+    generator = PDFReportGenerator(tmp_path)
+
+    elements = list(generator._parse_markdown_content("# Title\n## Section\n### Sub\n- item"))
+
+    assert [element.style.name for element in elements] == [
+        "Heading1",
+        "CustomHeading2",
+        "Heading3",
+        "CustomBody",
+    ]
+    assert elements[3].text == "• item"
+
+
+def test_parse_markdown_code_inside_bold(tmp_path: Path):
+    """Test inline code nested in bold text is formatted and escaped."""
+    generator = PDFReportGenerator(tmp_path)
+
+    [paragraph] = generator._parse_markdown_content("**run `x > 1` now**")
+
+    assert paragraph.text == (
+        '<b>run <font face="Courier" size="9" color="#c0392b">x &gt; 1</font> now</b>'
+    )
+
+
+def test_parse_markdown_fenced_code(tmp_path: Path):
+    """Test fenced code is rendered verbatim as one code block."""
+    generator = PDFReportGenerator(tmp_path)
+
+    elements = list(
+        generator._parse_markdown_content(
+            "Example:\n```python\ndef f():\n    return **x**\n```\nDone"
+        )
+    )
+
+    assert [type(element).__name__ for element in elements] == [
+        "Paragraph",
+        "Preformatted",
+        "Paragraph",
+    ]
+    assert elements[1].lines == ["def f():", "    return **x**"]
+    assert elements[1].style.name == "CodeBlock"
+
+
+def test_parse_markdown_wraps_long_code_lines(tmp_path: Path):
+    """Test code lines wider than the page wrap instead of running off it."""
+    generator = PDFReportGenerator(tmp_path)
+
+    [block] = generator._parse_markdown_content("```\n" + "x" * 300 + "\n```")
+
+    style = block.style
+    frame_width = A4[0] - 4 * cm - 12 - style.leftIndent - style.rightIndent
+    assert len(block.lines) > 1
+    assert "".join(line.strip() for line in block.lines) == "x" * 300
+    assert all(
+        stringWidth(line, style.fontName, style.fontSize) <= frame_width
+        for line in block.lines
+    )
+
+
+def test_parse_markdown_joins_body_lines(tmp_path: Path):
+    """Test consecutive body lines become one paragraph per block."""
+    generator = PDFReportGenerator(tmp_path)
+
+    elements = list(
+        generator._parse_markdown_content("one\n**two**\n\nthree\n- item\nfour")
+    )
+
+    assert [type(element).__name__ for element in elements] == [
+        "Paragraph",
+        "Spacer",
+        "Paragraph",
+        "Paragraph",
+        "Paragraph",
+    ]
+    assert elements[0].text == "one<br/><b>two</b>"
+    assert [element.text for element in elements[2:]] == ["three", "• item", "four"]
+
+
+def test_build_html(tmp_path: Path):
+    """Test the WeasyPrint backend renders markdown into an HTML report."""
+    generator = PDFReportGenerator(tmp_path, backend="weasyprint")
+
+    report_html = generator._build_html(
+        "https://github.com/test-user/test-repo",
+        "<repo>",
+        "## Overview\n\n```python\nx = 1\n```",
+        datetime(2024, 1, 2, 3, 4, 5),
+    )
+
+    assert "&lt;repo&gt; - Repository Analysis" in report_html
+    assert "2024-01-02 03:04:05" in report_html
+    assert "<h2>Overview</h2>" in report_html
+    assert "<pre><code" in report_html
+
+
+def test_weasyprint_backend_falls_back_to_reportlab(tmp_path: Path, mock_repo_url: str):
+    """Test reports are still generated when WeasyPrint is unavailable."""
+    generator = PDFReportGenerator(tmp_path, backend="weasyprint")
+
+    with patch("app.services.pdf_generator._load_weasyprint", return_value=None):
+        output_path = generator.generate(
+            analysis_result={"messages": [AIMessage(content="# Analysis")]},
+            repo_url=mock_repo_url,
+            project_name="test-repo",
+            output_filename="report.pdf",
+        )
+
+    assert output_path.read_bytes().startswith(b"%PDF")
+
+
+def test_extract_analysis_content(tmp_path: Path):
+    """Test non-empty string message contents are joined."""
+    generator = PDFReportGenerator(tmp_path)
+    messages = [
+        HumanMessage(content="Analyze"),
+        AIMessage(content="  "),
+        AIMessage(content=[{"type": "text", "text": "blocks"}]),
+        object(),
+        AIMessage(content="Report"),
+    ]
+
+    assert generator._extract_analysis_content(messages) == "Analyze\n\nReport"
+
+
+@pytest.mark.asyncio
+async def test_generate_async(tmp_path: Path, mock_repo_url: str):
+    """Test reports can be generated from async code."""
+    generator = create_pdf_generator(tmp_path)
+    analysis_result = {"messages": [AIMessage(content="# Analysis")]}
+
+    pdf_path = await generator.generate_async(
+        analysis_result, mock_repo_url, "test-repo", "async.pdf"
+    )
+
+    assert pdf_path == tmp_path / "async.pdf"
+    assert pdf_path.read_bytes().startswith(b"%PDF")
@@ -1,9 +1,15 @@
 """Tests for prompt management."""
 
+import re
+from pathlib import Path
+
 import pytest
 
 from app.prompts.base import PromptLoader, PromptTemplate
 
+# Expected error for rendering without required variables
+_MISSING_VARS = re.compile("Missing required variables")
+
 
 def test_prompt_template_render():
     """Test prompt template rendering."""
@@ -27,69 +33,88 @@ def test_prompt_template_missing_variable():
         variables=["name"],
     )
 
-    with pytest.raises(ValueError, match="Missing required variables"):
+    with pytest.raises(ValueError, match=_MISSING_VARS):
         template.render()
 
 
-def test_prompt_loader_load_system():
+def test_prompt_loader_load_system(system_template: PromptTemplate):
     """Test loading system prompt template."""
-    loader = PromptLoader()
-    template = loader.load("system")
-
-    assert template.name == "system_prompt"
-    assert "repo_url" in template.variables
+    assert system_template.name == "system_prompt"
+    assert "repo_url" in system_template.variables
 
 
-def test_prompt_loader_load_analysis():
+def test_prompt_loader_load_analysis(prompt_loader: PromptLoader):
     """Test loading analysis prompt template."""
-    loader = PromptLoader()
-    template = loader.load("analysis")
+    template = prompt_loader.load("analysis")
 
     assert template.name == "analysis_prompt"
     assert "repo_url" in template.variables
 
 
-def test_prompt_loader_render():
-    """Test prompt loader render method."""
-    loader = PromptLoader()
-    result = loader.render(
-        "system", repo_url="https://github.com/test-user/test-repo"
+def test_prompt_loader_render(system_template: PromptTemplate):
+    """Test rendering a loaded prompt template."""
+    result = system_template.render(
+        repo_url="https://github.com/test-user/test-repo", language="en"
     )
 
     assert "https://github.com/test-user/test-repo" in result
-    assert "GitHub repository analyst" in result
+    assert "analysis of the GitHub repository" in result
+    assert "write the entire analysis report in en language" in result
 
 
-def test_prompt_loader_cache():
+def test_prompt_loader_cache(clean_prompt_loader: PromptLoader):
     """Test prompt loader caching."""
-    loader = PromptLoader()
-
     # Load template twice
-    template1 = loader.load("system")
-    template2 = loader.load("system")
+    template1 = clean_prompt_loader.load("system")
+    template2 = clean_prompt_loader.load("system")
 
     # Should be the same object (cached)
     assert template1 is template2
 
 
-def test_prompt_loader_clear_cache():
-    """Test clearing prompt loader cache."""
-    loader = PromptLoader()
+def test_prompt_loaders_share_compiled_templates(clean_prompt_loader: PromptLoader):
+    """Test separate loaders reuse the same compiled template."""
+    assert PromptLoader().load("system") is clean_prompt_loader.load("system")
+
 
+def test_prompt_loader_clear_cache(clean_prompt_loader: PromptLoader):
+    """Test clearing prompt loader cache."""
     # Load and cache template
-    template1 = loader.load("system")
-    loader.clear_cache()
+    template1 = clean_prompt_loader.load("system")
+    clean_prompt_loader.clear_cache()
 
     # Load again after clearing cache
-    template2 = loader.load("system")
+    template2 = clean_prompt_loader.load("system")
 
     # Should be different objects
     assert template1 is not template2
 
 
-def test_prompt_loader_file_not_found():
+def test_prompt_loader_file_not_found(tmp_path: Path):
     """Test loading non-existent template raises error."""
-    loader = PromptLoader()
+    loader = PromptLoader(tmp_path)
 
     with pytest.raises(FileNotFoundError):
         loader.load("nonexistent")
+
+
+@pytest.mark.asyncio
+async def test_prompt_loader_warm():
+    """Test warming the loader caches every template."""
+    loader = PromptLoader()
+
+    await loader.warm()
+
+    assert {"system", "analysis", "report"} <= set(loader._cache)
+
+
+@pytest.mark.asyncio
+async def test_prompt_loader_aload():
+    """Test async loading reads once and then returns the cached template."""
+    loader = PromptLoader()
+
+    template = await loader.aload("system")
+
+    assert template.name == "system_prompt"
+    assert await loader.aload("system") is template
+    assert loader.load("system") is template
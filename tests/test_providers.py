@@ -1,61 +1,51 @@
+import re
+
 import pytest
 
-from app.core.config import Settings
+from app.config import Settings
 from app.providers.llm import get_llm
 
-
-def test_get_llm_openai():
-    settings = Settings(
-        openai_api_key="test-key",
-        llm_provider="openai",
-        llm_model="gpt-4o-mini"
-    )
-    llm = get_llm(settings)
-    assert llm is not None
-    assert llm.model_name == "gpt-4o-mini"
-
-
-def test_get_llm_openai_missing_key():
-    settings = Settings(llm_provider="openai", openai_api_key=None)
-    with pytest.raises(ValueError, match="OPENAI_API_KEY is required"):
-        get_llm(settings)
-
-
-def test_get_llm_gemini():
-    settings = Settings(
-        gemini_api_key="test-key",
-        llm_provider="gemini",
-        llm_model="gemini-1.5-pro-latest"
-    )
-    llm = get_llm(settings)
+# Expected get_llm errors, compiled once
+_OPENAI_KEY = re.compile("OPENAI_API_KEY is required")
+_GEMINI_KEY = re.compile("GEMINI_API_KEY is required")
+_OPENROUTER_KEY = re.compile("OPENROUTER_API_KEY is required")
+_UNSUPPORTED = re.compile("Unsupported LLM provider")
+
+
+@pytest.mark.parametrize(
+    "provider,model,model_attr",
+    [
+        ("openai", "gpt-4o-mini", "model_name"),
+        ("gemini", "gemini-1.5-pro-latest", "model"),
+        ("openrouter", "openrouter/auto", "model_name"),
+    ],
+)
+def test_get_llm_success(provider_settings, provider, model, model_attr):
+    llm = get_llm(provider_settings(provider, model, True))
     assert llm is not None
+    assert getattr(llm, model_attr) == model
 
 
-def test_get_llm_gemini_missing_key():
-    settings = Settings(llm_provider="gemini", gemini_api_key=None)
-    with pytest.raises(ValueError, match="GEMINI_API_KEY is required"):
-        get_llm(settings)
-
-
-def test_get_llm_openrouter():
-    settings = Settings(
-        openrouter_api_key="test-key",
-        llm_provider="openrouter",
-        llm_model="openrouter/auto"
-    )
-    llm = get_llm(settings)
-    assert llm is not None
-
-
-def test_get_llm_openrouter_missing_key():
-    settings = Settings(llm_provider="openrouter", openrouter_api_key=None)
-    with pytest.raises(ValueError, match="OPENROUTER_API_KEY is required"):
-        get_llm(settings)
+@pytest.mark.parametrize(
+    "provider,model,error_match",
+    [
+        ("openai", "gpt-4o-mini", _OPENAI_KEY),
+        ("gemini", "gemini-1.5-pro-latest", _GEMINI_KEY),
+        ("openrouter", "openrouter/auto", _OPENROUTER_KEY),
+    ],
+)
+def test_get_llm_missing_key(provider_settings, provider, model, error_match):
+    with pytest.raises(ValueError, match=error_match):
+        get_llm(provider_settings(provider, model, False))
 
 
 def test_get_llm_unsupported_provider():
     settings = Settings(llm_provider="openai", openai_api_key="test")
     settings.llm_provider = "unsupported"  # type: ignore
-    with pytest.raises(ValueError, match="Unsupported LLM provider"):
+    with pytest.raises(ValueError, match=_UNSUPPORTED):
         get_llm(settings)
 
+
+def test_get_llm_reuses_instance(provider_settings):
+    settings = provider_settings("openai", "gpt-4o-mini", True)
+    assert get_llm(settings) is get_llm(settings)
@@ -0,0 +1,114 @@
+"""Tests for async streaming utilities."""
+
+import asyncio
+
+import pytest
+
+from app.core.streaming import buffered, with_heartbeat
+
+
+async def _numbers(count: int):
+    for number in range(count):
+        yield number
+
+
+async def _failing():
+    yield 1
+    raise ValueError("source failed")
+
+
+@pytest.mark.asyncio
+async def test_buffered_preserves_order():
+    """Test buffered iterator yields every item in order."""
+    items = [item async for item in buffered(_numbers(10), 2)]
+
+    assert items == list(range(10))
+
+
+@pytest.mark.asyncio
+async def test_buffered_propagates_errors():
+    """Test errors from the source iterator reach the consumer."""
+    items = []
+
+    with pytest.raises(ValueError, match="source failed"):
+        async for item in buffered(_failing(), 2):
+            items.append(item)
+
+    assert items == [1]
+
+
+@pytest.mark.asyncio
+async def test_buffered_early_exit():
+    """Test breaking out early stops the producer."""
+    stream = buffered(_numbers(100), 2)
+
+    async for item in stream:
+        if item == 3:
+            break
+    await stream.aclose()
+
+    assert item == 3
+
+
+async def _endless(closed: list):
+    try:
+        number = 0
+        while True:
+            yield number
+            number += 1
+    finally:
+        closed.append(True)
+
+
+@pytest.mark.asyncio
+async def test_buffered_early_exit_with_full_buffer():
+    """Test closing promptly while the producer waits on a full buffer."""
+    closed = []
+    stream = buffered(_endless(closed), 2)
+
+    async for _ in stream:
+        # Let the producer fill the buffer and block on it
+        await asyncio.sleep(0.01)
+        break
+    await asyncio.wait_for(stream.aclose(), timeout=1)
+
+    assert closed == [True]
+
+
+async def _slow_numbers():
+    yield 1
+    await asyncio.sleep(0.05)
+    yield 2
+
+
+@pytest.mark.asyncio
+async def test_with_heartbeat_fills_idle_gaps():
+    """Test heartbeats are yielded while the source iterator is idle."""
+    items = [item async for item in with_heartbeat(_slow_numbers(), 0.01, "ping")]
+
+    assert items[0] == 1
+    assert items[-1] == 2
+    assert "ping" in items[1:-1]
+
+
+@pytest.mark.asyncio
+async def test_with_heartbeat_propagates_errors():
+    """Test errors from the source iterator reach the consumer."""
+    with pytest.raises(ValueError, match="source failed"):
+        async for _ in with_heartbeat(_failing(), 1, "ping"):
+            pass
+
+
+@pytest.mark.asyncio
+async def test_with_heartbeat_close_with_full_queue():
+    """Test closing promptly while the producer waits on a full queue."""
+    closed = []
+    stream = with_heartbeat(_endless(closed), 1, "ping")
+
+    async for _ in stream:
+        # Let the producer fill the queue and block on it
+        await asyncio.sleep(0.01)
+        break
+    await asyncio.wait_for(stream.aclose(), timeout=1)
+
+    assert closed == [True]